@@ -1,13 +1,49 @@
 #!/usr/bin/env python3
 """ScholarStream Blackboard - Shared state management for agent coordination"""
+import asyncio
 import json
 import hashlib
 from typing import Dict, List, Any, Optional, Callable
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict, field
 from threading import Lock
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import bisect
+import heapq
+import itertools
+import os
+import time
+import uuid
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locking only
+    fcntl = None
+
+
+@contextmanager
+def _file_lock(lock_path: Path):
+    """Hold an exclusive advisory lock on lock_path for the duration of the block."""
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a") as handle:
+        if fcntl:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _atomic_write(path: Path, text: str):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
 
 
 @dataclass
@@ -18,6 +54,7 @@ class BlackboardEntry:
     confidence: float
     tags: List[str] = field(default_factory=list)
     entry_type: str = "info"
+    expires_at: Optional[str] = None
 
     def to_dict(self) -> Dict:
         return asdict(self)
@@ -31,75 +68,124 @@ class BlackboardEntry:
         hash_input = f"{self.agent}{self.timestamp}{content_str}"
         return hashlib.md5(hash_input.encode()).hexdigest()[:12]
 
+    def expiry_epoch(self) -> Optional[float]:
+        if not self.expires_at:
+            return None
+        return datetime.fromisoformat(self.expires_at).timestamp()
+
 
 class ScholarStreamBlackboard:
     DEFAULT_STORAGE_PATH = "database/blackboard.json"
-
-    def __init__(self, storage_path: Optional[str] = None):
+    QUERY_CACHE_SIZE = 128
+    EVICTION_INTERVAL = 30.0
+    DEFAULT_LEASE_SECONDS = 300.0
+    MAX_TASK_ATTEMPTS = 5
+    CHANGELOG_MAX_BYTES = 8 * 1024 * 1024
+
+    def __init__(self, storage_path: Optional[str] = None,
+                 query_cache_size: Optional[int] = None,
+                 changelog: bool = True):
         self.entries: List[BlackboardEntry] = []
         self.knowledge_base: Dict[str, Any] = {}
         self.subscribers: Dict[str, Any] = {}
         self.lock = Lock()
+        # Mutation generation; cached query results are only served when
+        # their stamp matches the current generation.
+        self._generation = 0
+        self._query_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._query_cache_size = (
+            self.QUERY_CACHE_SIZE if query_cache_size is None else query_cache_size
+        )
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # Min-heap of (expiry epoch, seq, entry) for entries posted with a ttl
+        self._expiry_heap: List[tuple] = []
+        self._expiry_seq = itertools.count()
+        self._last_eviction = time.time()
         self.storage_path = Path(storage_path) if storage_path else Path(self.DEFAULT_STORAGE_PATH)
+        # The task queue lives in its own file so that claims from several
+        # processes never race with whole-blackboard saves.
+        self.queue_path = self.storage_path.with_name(f"{self.storage_path.stem}_tasks.json")
+        self._queue_lock_path = self.queue_path.with_name(f"{self.queue_path.name}.lock")
+        # Mutations not yet appended to the change log that replicas tail
+        self.changelog = changelog
+        self.changelog_path = self.changelog_path_for(self.storage_path)
+        self._pending_changes: List[Dict[str, Any]] = []
         self._dirty = False
+        # Entries that had already expired on disk; kept dirty so the next
+        # save drops them, and reported by the next evict_expired()
+        self._evicted_on_load = 0
         if self.storage_path:
-            self._load_from_disk()
-            self._dirty = False
+            self._evicted_on_load = self._load_from_disk()
+            self._dirty = self._evicted_on_load > 0
 
     def post(self, agent: str, content: Any,
              confidence: float = 1.0, tags: Optional[List[str]] = None,
-             entry_type: str = "info") -> BlackboardEntry:
-        entry = BlackboardEntry(
-            agent=agent,
-            content=content,
-            timestamp=datetime.now().isoformat(),
-            confidence=confidence,
-            tags=tags or [],
-            entry_type=entry_type
-        )
+             entry_type: str = "info",
+             ttl: Optional[float] = None) -> BlackboardEntry:
+        return self.post_many([{
+            "agent": agent,
+            "content": content,
+            "confidence": confidence,
+            "tags": tags,
+            "entry_type": entry_type,
+            "ttl": ttl
+        }])[0]
+
+    def post_many(self, posts: List[Dict[str, Any]]) -> List[BlackboardEntry]:
+        entries = [self._new_entry(**post) for post in posts]
 
         with self.lock:
+            if time.time() - self._last_eviction >= self.EVICTION_INTERVAL:
+                self._evict_expired()
             # Use insert + sort for compatibility (bisect.insort with key is Python 3.10+ only)
-            self.entries.append(entry)
+            self.entries.extend(entries)
             self.entries.sort(key=lambda e: e.timestamp)
-            self._notify_subscribers(entry)
+            for entry in entries:
+                self._track_expiry(entry)
+                self._bump_generation(entry)
+                self._notify_subscribers(entry)
+                self._record_change("post", entry=entry.to_dict())
             self._dirty = True
 
-        return entry
+        return entries
 
     def query(self, agent: str, query_tags: List[str],
               since: Optional[str] = None,
               entry_type: Optional[str] = None,
               min_confidence: float = 0.0,
               max_results: int = 50) -> List[BlackboardEntry]:
-        with self.lock:
-            results = []
-
-            for entry in self.entries:
-                if since and entry.timestamp <= since:
-                    continue
-
-                if entry_type and entry.entry_type != entry_type:
-                    continue
+        key = self._query_key(query_tags, since, entry_type, min_confidence, max_results)
 
-                if entry.confidence < min_confidence:
-                    continue
-
-                if not self._matches_tags(entry.tags, query_tags):
-                    continue
+        with self.lock:
+            self._evict_expired()
+            cached = self._query_cache.get(key)
+            if cached is not None and cached[0] == self._generation:
+                self._query_cache.move_to_end(key)
+                self._cache_hits += 1
+                return list(cached[1])
+
+            self._cache_misses += 1
+            results = [
+                entry for entry in self.entries
+                if self._entry_matches(entry, key)
+            ]
 
-                results.append(entry)
+            sorted_results = sorted(results, key=lambda e: e.confidence, reverse=True)
+            sorted_results = sorted_results[:max_results]
+            self._cache_store(key, sorted_results)
 
-        sorted_results = sorted(results, key=lambda e: e.confidence, reverse=True)
-        return sorted_results[:max_results]
+        return list(sorted_results)
 
     def get_latest_by_agent(self, agent: str, limit: int = 10) -> List[BlackboardEntry]:
         with self.lock:
+            self._evict_expired()
             agent_entries = [e for e in self.entries if e.agent == agent]
             return agent_entries[-limit:]
 
     def get_by_id(self, entry_id: str) -> Optional[BlackboardEntry]:
         with self.lock:
+            self._evict_expired()
             for entry in self.entries:
                 if entry.get_id() == entry_id:
                     return entry
@@ -137,6 +223,7 @@ class ScholarStreamBlackboard:
                 "agent": agent,
                 "timestamp": datetime.now().isoformat()
             }
+            self._record_change("knowledge", key=key, record=self.knowledge_base[key])
             self._dirty = True
 
     def retrieve_knowledge(self, key: str) -> Optional[Any]:
@@ -161,10 +248,67 @@ class ScholarStreamBlackboard:
                 self.entries = [e for e in self.entries if e.agent != agent]
             else:
                 self.entries = []
+            self._rebuild_expiry_heap()
+            self._bump_generation()
+            self._record_change("clear", agent=agent)
             self._dirty = True
 
+    def apply_changes(self, changes: List[Dict[str, Any]]) -> int:
+        """Replay change-log records (see BlackboardReplica) onto this blackboard."""
+        applied = 0
+        with self.lock:
+            known_ids = {e.get_id() for e in self.entries}
+            new_entries = []
+
+            for change in changes:
+                op = change.get("op")
+                if op == "post":
+                    entry = BlackboardEntry.from_dict(change["entry"])
+                    if entry.get_id() in known_ids:
+                        continue
+                    known_ids.add(entry.get_id())
+                    new_entries.append(entry)
+                elif op == "knowledge":
+                    self.knowledge_base[change["key"]] = change["record"]
+                elif op == "clear":
+                    self.entries.extend(new_entries)
+                    new_entries = []
+                    agent = change.get("agent")
+                    self.entries = [e for e in self.entries if agent and e.agent != agent]
+                    known_ids = {e.get_id() for e in self.entries}
+                else:
+                    continue
+                applied += 1
+
+            self.entries.extend(new_entries)
+            self.entries.sort(key=lambda e: e.timestamp)
+            self._rebuild_expiry_heap()
+            self._bump_generation()
+            self._evict_expired()
+            if self.changelog:
+                self._pending_changes.extend(
+                    c for c in changes if c.get("op") in ("post", "knowledge", "clear")
+                )
+            self._dirty = True
+
+        return applied
+
+    def restore(self, data: Dict[str, Any]):
+        """Replace the whole state with a snapshot as written by save_now()."""
+        with self.lock:
+            self._restore(data)
+            self._dirty = True
+
+    def evict_expired(self) -> int:
+        """Drop expired entries, counting any already dropped while loading."""
+        with self.lock:
+            removed = self._evict_expired() + self._evicted_on_load
+            self._evicted_on_load = 0
+            return removed
+
     def get_stats(self) -> Dict[str, Any]:
         with self.lock:
+            self._evict_expired()
             by_agent: Dict[str, int] = {}
             by_type: Dict[str, int] = {}
 
@@ -172,16 +316,119 @@ class ScholarStreamBlackboard:
                 by_agent[entry.agent] = by_agent.get(entry.agent, 0) + 1
                 by_type[entry.entry_type] = by_type.get(entry.entry_type, 0) + 1
 
+            lookups = self._cache_hits + self._cache_misses
+
             return {
                 "total_entries": len(self.entries),
                 "knowledge_keys": len(self.knowledge_base),
                 "by_agent": by_agent,
                 "by_type": by_type,
-                "subscribers": len(self.subscribers)
+                "subscribers": len(self.subscribers),
+                "expiring_entries": len(self._expiry_heap),
+                "query_cache": {
+                    "size": len(self._query_cache),
+                    "capacity": self._query_cache_size,
+                    "hits": self._cache_hits,
+                    "misses": self._cache_misses,
+                    "hit_rate": self._cache_hits / lookups if lookups else 0.0,
+                    "generation": self._generation
+                }
+            }
+
+    def enqueue(self, task: Any, priority: int = 0, agent: str = "manager",
+                task_id: Optional[str] = None) -> str:
+        task_id = task_id or uuid.uuid4().hex[:12]
+
+        with self.lock, _file_lock(self._queue_lock_path):
+            tasks = self._load_queue()
+            tasks[task_id] = {
+                "id": task_id,
+                "task": task,
+                "priority": priority,
+                "agent": agent,
+                "status": "queued",
+                "enqueued_at": datetime.now().isoformat(),
+                "worker": None,
+                "lease_expires": None,
+                "lease_seconds": None,
+                "attempts": 0
             }
+            self._save_queue(tasks)
+
+        return task_id
+
+    def claim(self, worker: str,
+              lease_seconds: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        lease_seconds = lease_seconds or self.DEFAULT_LEASE_SECONDS
+
+        with self.lock, _file_lock(self._queue_lock_path):
+            tasks = self._load_queue()
+            now = time.time()
+            changed = self._requeue_expired_leases(tasks, now)
+
+            candidates = [t for t in tasks.values() if t["status"] == "queued"]
+            if not candidates:
+                if changed:
+                    self._save_queue(tasks)
+                return None
+
+            # Highest priority first, FIFO within the same priority
+            candidates.sort(key=lambda t: (-t["priority"], t["enqueued_at"]))
+            task = candidates[0]
+            task["status"] = "leased"
+            task["worker"] = worker
+            task["lease_seconds"] = lease_seconds
+            task["lease_expires"] = now + lease_seconds
+            task["attempts"] += 1
+            self._save_queue(tasks)
+
+            return dict(task)
+
+    def heartbeat(self, task_id: str, worker: Optional[str] = None,
+                  lease_seconds: Optional[float] = None) -> bool:
+        with self.lock, _file_lock(self._queue_lock_path):
+            tasks = self._load_queue()
+            task = tasks.get(task_id)
+            if not task or task["status"] != "leased":
+                return False
+            if worker and task["worker"] != worker:
+                return False
+
+            task["lease_expires"] = time.time() + (lease_seconds or task["lease_seconds"])
+            self._save_queue(tasks)
+            return True
+
+    def complete(self, task_id: str, worker: Optional[str] = None) -> bool:
+        with self.lock, _file_lock(self._queue_lock_path):
+            tasks = self._load_queue()
+            task = tasks.get(task_id)
+            if not task or task["status"] == "failed":
+                return False
+            if worker and task["worker"] != worker:
+                return False
+
+            del tasks[task_id]
+            self._save_queue(tasks)
+            return True
+
+    def list_tasks(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        with self.lock, _file_lock(self._queue_lock_path):
+            tasks = self._load_queue()
+            if self._requeue_expired_leases(tasks, time.time()):
+                self._save_queue(tasks)
+
+        results = [t for t in tasks.values() if not status or t["status"] == status]
+        return sorted(results, key=lambda t: (-t["priority"], t["enqueued_at"]))
+
+    def queue_stats(self) -> Dict[str, int]:
+        by_status: Dict[str, int] = {}
+        for task in self.list_tasks():
+            by_status[task["status"]] = by_status.get(task["status"], 0) + 1
+        return by_status
 
     def save_now(self):
         with self.lock:
+            self._evict_expired()
             if self._dirty and self.storage_path:
                 self._save_to_disk()
                 self._dirty = False
@@ -189,6 +436,124 @@ class ScholarStreamBlackboard:
     def __del__(self):
         self.save_now()
 
+    @staticmethod
+    def _new_entry(agent: str, content: Any, confidence: float = 1.0,
+                   tags: Optional[List[str]] = None, entry_type: str = "info",
+                   ttl: Optional[float] = None,
+                   timestamp: Optional[datetime] = None) -> BlackboardEntry:
+        now = timestamp or datetime.now()
+        return BlackboardEntry(
+            agent=agent,
+            content=content,
+            timestamp=now.isoformat(),
+            confidence=confidence,
+            tags=tags or [],
+            entry_type=entry_type,
+            expires_at=(now + timedelta(seconds=ttl)).isoformat() if ttl is not None else None
+        )
+
+    @staticmethod
+    def _query_key(query_tags: Optional[List[str]], since: Optional[str],
+                   entry_type: Optional[str], min_confidence: float,
+                   max_results: int) -> tuple:
+        tags = tuple(sorted({tag.lower() for tag in (query_tags or [])}))
+        return (tags, since, entry_type, float(min_confidence), max_results)
+
+    def _entry_matches(self, entry: BlackboardEntry, key: tuple) -> bool:
+        query_tags, since, entry_type, min_confidence, _ = key
+
+        if since and entry.timestamp <= since:
+            return False
+
+        if entry_type and entry.entry_type != entry_type:
+            return False
+
+        if entry.confidence < min_confidence:
+            return False
+
+        return self._matches_tags(entry.tags, list(query_tags))
+
+    def _cache_store(self, key: tuple, results: List[BlackboardEntry]):
+        if self._query_cache_size <= 0:
+            return
+
+        self._query_cache[key] = (self._generation, results)
+        self._query_cache.move_to_end(key)
+        while len(self._query_cache) > self._query_cache_size:
+            self._query_cache.popitem(last=False)
+
+    def _bump_generation(self, entry: Optional[BlackboardEntry] = None):
+        """Advance the mutation generation and invalidate affected queries.
+
+        When the mutation is a single entry, only cached queries that entry
+        would match are dropped; the rest are re-stamped so that posts to
+        unrelated tags keep them warm. Bulk mutations drop the whole cache.
+        """
+        self._generation += 1
+
+        if entry is None:
+            self._query_cache.clear()
+            return
+
+        for key in list(self._query_cache):
+            stamp, results = self._query_cache[key]
+            if self._entry_matches(entry, key):
+                del self._query_cache[key]
+            else:
+                self._query_cache[key] = (self._generation, results)
+
+    def _track_expiry(self, entry: BlackboardEntry):
+        expiry = entry.expiry_epoch()
+        if expiry is not None:
+            heapq.heappush(self._expiry_heap, (expiry, next(self._expiry_seq), entry))
+
+    def _rebuild_expiry_heap(self):
+        self._expiry_heap = []
+        for entry in self.entries:
+            self._track_expiry(entry)
+
+    def _evict_expired(self, now: Optional[float] = None) -> int:
+        """Drop entries whose ttl has elapsed; must be called with the lock held."""
+        now = time.time() if now is None else now
+        self._last_eviction = now
+
+        expired = []
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expired.append(heapq.heappop(self._expiry_heap)[2])
+
+        if not expired:
+            return 0
+
+        expired_ids = {id(entry) for entry in expired}
+        before = len(self.entries)
+        self.entries = [e for e in self.entries if id(e) not in expired_ids]
+        removed = before - len(self.entries)
+
+        for entry in expired:
+            self._bump_generation(entry)
+        if removed:
+            self._dirty = True
+
+        return removed
+
+    def _requeue_expired_leases(self, tasks: Dict[str, Dict], now: float) -> bool:
+        changed = False
+        for task in tasks.values():
+            if task["status"] == "leased" and task["lease_expires"] <= now:
+                task["status"] = "failed" if task["attempts"] >= self.MAX_TASK_ATTEMPTS else "queued"
+                task["worker"] = None
+                task["lease_expires"] = None
+                changed = True
+        return changed
+
+    def _load_queue(self) -> Dict[str, Dict]:
+        if not self.queue_path.exists():
+            return {}
+        return json.loads(self.queue_path.read_text(encoding="utf-8")).get("tasks", {})
+
+    def _save_queue(self, tasks: Dict[str, Dict]):
+        _atomic_write(self.queue_path, json.dumps({"tasks": tasks}, indent=2))
+
     def _matches_tags(self, entry_tags: List[str], query_tags: List[str]) -> bool:
         if not query_tags:
             return True
@@ -212,40 +577,299 @@ class ScholarStreamBlackboard:
                     except Exception as e:
                         print(f"Error notifying subscriber: {e}")
 
+    @staticmethod
+    def changelog_path_for(storage_path: Path) -> Path:
+        return storage_path.with_name(f"{storage_path.stem}_changes.jsonl")
+
+    def _record_change(self, op: str, **fields):
+        if self.changelog:
+            self._pending_changes.append({"op": op, "at": datetime.now().isoformat(), **fields})
+
+    def _snapshot(self) -> Dict[str, Any]:
+        return {
+            "entries": [e.to_dict() for e in self.entries],
+            "knowledge_base": self.knowledge_base
+        }
+
     def _save_to_disk(self):
         if not self.storage_path:
             return
 
         try:
-            data = {
-                "entries": [e.to_dict() for e in self.entries],
-                "knowledge_base": self.knowledge_base
-            }
-
-            self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-            self.storage_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            text = json.dumps(self._snapshot(), indent=2)
+
+            if not self.changelog:
+                _atomic_write(self.storage_path, text)
+                return
+
+            # Snapshot and log are updated under one lock so a replica that
+            # bootstraps from the snapshot always finds a matching log header.
+            lock_path = self.changelog_path.with_name(f"{self.changelog_path.name}.lock")
+            with _file_lock(lock_path):
+                _atomic_write(self.storage_path, text)
+                self._append_changelog()
         except Exception as e:
             print(f"Error saving blackboard: {e}")
 
-    def _load_from_disk(self):
+    def _append_changelog(self):
+        if self.changelog_path.exists() and self.changelog_path.stat().st_size > self.CHANGELOG_MAX_BYTES:
+            # Rotate: the snapshot just written already holds everything logged so far
+            self.changelog_path.unlink()
+            self._pending_changes = []
+
+        if not self.changelog_path.exists():
+            header = {"log_id": uuid.uuid4().hex, "created": datetime.now().isoformat()}
+            _atomic_write(self.changelog_path, json.dumps(header) + "\n")
+
+        if self._pending_changes:
+            with open(self.changelog_path, "a", encoding="utf-8") as handle:
+                for change in self._pending_changes:
+                    handle.write(json.dumps(change, default=str) + "\n")
+            self._pending_changes = []
+
+    def _restore(self, data: Dict[str, Any]) -> int:
+        self.entries = [
+            BlackboardEntry.from_dict(e) for e in data.get("entries", [])
+        ]
+        self.knowledge_base = data.get("knowledge_base", {})
+        self._rebuild_expiry_heap()
+        self._bump_generation()
+        return self._evict_expired()
+
+    def _load_from_disk(self) -> int:
         if not self.storage_path or not self.storage_path.exists():
-            return
+            return 0
 
         try:
             data = json.loads(self.storage_path.read_text(encoding="utf-8"))
-
-            self.entries = [
-                BlackboardEntry.from_dict(e) for e in data.get("entries", [])
-            ]
-            self.knowledge_base = data.get("knowledge_base", {})
+            return self._restore(data)
         except Exception as e:
             print(f"Error loading blackboard: {e}")
-            self.entries = []
-            self.knowledge_base = {}
+            return self._restore({})
+
+
+class BlackboardReplica:
+    """Read-only follower of a blackboard, fed by tailing the leader's change log.
+
+    The replica keeps a cursor (change-log id + byte offset) next to its own
+    storage file, so sync() resumes where the previous run stopped. When the
+    leader rotates its log, the replica re-bootstraps from the leader snapshot.
+    """
+
+    def __init__(self, leader_path: Optional[str] = None, replica_path: Optional[str] = None):
+        self.leader_path = Path(leader_path or ScholarStreamBlackboard.DEFAULT_STORAGE_PATH)
+        if replica_path:
+            replica = Path(replica_path)
+        else:
+            replica = self.leader_path.with_name(f"{self.leader_path.stem}_replica.json")
+        self.follower = ScholarStreamBlackboard(str(replica), changelog=False)
+        self.changelog_path = ScholarStreamBlackboard.changelog_path_for(self.leader_path)
+        self._lock_path = self.changelog_path.with_name(f"{self.changelog_path.name}.lock")
+        self.cursor_path = replica.with_name(f"{replica.stem}_cursor.json")
+        self.cursor = self._load_cursor()
+
+    def sync(self) -> int:
+        """Apply all complete change records written since the cursor."""
+        snapshot = None
+        with _file_lock(self._lock_path):
+            log_id, header_end = self._read_header()
+
+            if log_id is None or log_id != self.cursor["log_id"]:
+                if self.leader_path.exists():
+                    snapshot = json.loads(self.leader_path.read_text(encoding="utf-8"))
+                self.cursor.update({"log_id": log_id, "offset": header_end})
+
+            chunk = b""
+            if log_id is not None:
+                with open(self.changelog_path, "rb") as handle:
+                    handle.seek(self.cursor["offset"])
+                    chunk = handle.read()
+
+        # Only consume whole lines; a partial trailing record is picked up next time
+        complete = chunk[:chunk.rfind(b"\n") + 1]
+        changes = [json.loads(line) for line in complete.splitlines() if line.strip()]
+
+        if snapshot is not None:
+            self.follower.restore(snapshot)
+        applied = self.follower.apply_changes(changes) if changes else 0
+
+        self.cursor["offset"] += len(complete)
+        self.cursor["records_applied"] += len(changes)
+        self.cursor["last_sync_at"] = datetime.now().isoformat()
+        if changes:
+            self.cursor["last_change_at"] = changes[-1].get("at")
+
+        # Persist replica data before the cursor so a crash replays, never skips
+        self.follower.save_now()
+        _atomic_write(self.cursor_path, json.dumps(self.cursor, indent=2))
+
+        return applied
+
+    def follow(self, interval: float = 1.0, iterations: Optional[int] = None):
+        count = 0
+        while iterations is None or count < iterations:
+            self.sync()
+            count += 1
+            time.sleep(interval)
+
+    def lag(self) -> Dict[str, Any]:
+        log_bytes = self.changelog_path.stat().st_size if self.changelog_path.exists() else 0
+        log_id, _ = self._read_header()
+        needs_bootstrap = log_id != self.cursor["log_id"]
+        pending = log_bytes if needs_bootstrap else max(log_bytes - self.cursor["offset"], 0)
+
+        lag_seconds = 0.0
+        if pending and self.cursor.get("last_change_at"):
+            last = datetime.fromisoformat(self.cursor["last_change_at"])
+            lag_seconds = (datetime.now() - last).total_seconds()
+
+        return {
+            "log_id": self.cursor["log_id"],
+            "log_bytes": log_bytes,
+            "cursor_offset": self.cursor["offset"],
+            "pending_bytes": pending,
+            "needs_bootstrap": needs_bootstrap,
+            "records_applied": self.cursor["records_applied"],
+            "last_sync_at": self.cursor.get("last_sync_at"),
+            "last_change_at": self.cursor.get("last_change_at"),
+            "lag_seconds": lag_seconds
+        }
+
+    def _read_header(self) -> tuple:
+        if not self.changelog_path.exists():
+            return None, 0
+        with open(self.changelog_path, "rb") as handle:
+            line = handle.readline()
+        if not line.endswith(b"\n"):
+            return None, 0
+        return json.loads(line).get("log_id"), len(line)
+
+    def _load_cursor(self) -> Dict[str, Any]:
+        cursor = {"log_id": None, "offset": 0, "records_applied": 0,
+                  "last_sync_at": None, "last_change_at": None}
+        if self.cursor_path.exists():
+            try:
+                cursor.update(json.loads(self.cursor_path.read_text(encoding="utf-8")))
+            except Exception as e:
+                print(f"Error loading replica cursor, re-bootstrapping: {e}")
+        return cursor
+
+
+class AsyncBlackboard:
+    """Asyncio facade over ScholarStreamBlackboard.
+
+    Blocking blackboard calls run on a dedicated worker thread so they never
+    stall the event loop. Posts are buffered and written as one batch every
+    flush_interval seconds (or sooner once max_batch posts are pending).
+
+    Usage:
+        async with AsyncBlackboard() as bb:
+            await bb.post("url-validator", result, tags=["url_validation"])
+    """
+
+    def __init__(self, blackboard: Optional[ScholarStreamBlackboard] = None,
+                 flush_interval: float = 0.5, max_batch: int = 500,
+                 save_on_flush: bool = True):
+        self.blackboard = blackboard or ScholarStreamBlackboard()
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.save_on_flush = save_on_flush
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="blackboard")
+        self._pending: List[Dict[str, Any]] = []
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def close(self):
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        await self.flush()
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> 'AsyncBlackboard':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def post(self, agent: str, content: Any,
+                   confidence: float = 1.0, tags: Optional[List[str]] = None,
+                   entry_type: str = "info", ttl: Optional[float] = None):
+        """Buffer a post; it is written on the next flush, stamped with the post time."""
+        self._pending.append({
+            "agent": agent,
+            "content": content,
+            "confidence": confidence,
+            "tags": tags,
+            "entry_type": entry_type,
+            "ttl": ttl,
+            "timestamp": datetime.now()
+        })
+        if len(self._pending) >= self.max_batch:
+            await self.flush()
+
+    async def query(self, agent: str, query_tags: List[str], **kwargs) -> List[BlackboardEntry]:
+        # Flush first so callers always read their own writes
+        await self.flush()
+        return await self._run(self.blackboard.query, agent, query_tags, **kwargs)
+
+    async def store_knowledge(self, key: str, value: Any, agent: str):
+        await self._run(self.blackboard.store_knowledge, key, value, agent)
+
+    async def retrieve_knowledge(self, key: str) -> Optional[Any]:
+        return await self._run(self.blackboard.retrieve_knowledge, key)
+
+    async def get_stats(self) -> Dict[str, Any]:
+        await self.flush()
+        return await self._run(self.blackboard.get_stats)
+
+    async def flush(self) -> List[BlackboardEntry]:
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return []
+
+            try:
+                entries = await self._run(self.blackboard.post_many, batch)
+            except Exception:
+                # Put the batch back ahead of anything posted meanwhile so
+                # the next flush retries it in order
+                self._pending = batch + self._pending
+                raise
+            if self.save_on_flush:
+                await self._run(self.blackboard.save_now)
+            return entries
+
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"Error flushing blackboard batch ({len(self._pending)} posts kept for retry): {e}")
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
 
 
 def main():
     import argparse
+    import sys
 
     parser = argparse.ArgumentParser(
         description="ScholarStream Blackboard CLI"
@@ -258,12 +882,52 @@ def main():
     query_parser.add_argument("--tags", nargs="+", help="Tags to search")
     query_parser.add_argument("--max", type=int, default=10, help="Max results")
 
+    evict_parser = subparsers.add_parser("evict", help="Remove expired entries and save")
+
+    enqueue_parser = subparsers.add_parser("enqueue", help="Add a task to the work queue")
+    enqueue_parser.add_argument("task", help="Task payload (JSON or plain text)")
+    enqueue_parser.add_argument("--priority", type=int, default=0, help="Higher runs first")
+    enqueue_parser.add_argument("--agent", default="cli", help="Submitting agent")
+
+    claim_parser = subparsers.add_parser("claim", help="Lease the next queued task")
+    claim_parser.add_argument("--worker", required=True, help="Worker name")
+    claim_parser.add_argument("--lease", type=float, help="Lease length in seconds")
+
+    heartbeat_parser = subparsers.add_parser("heartbeat", help="Extend a task lease")
+    heartbeat_parser.add_argument("task_id", help="Task id")
+    heartbeat_parser.add_argument("--worker", help="Worker holding the lease")
+    heartbeat_parser.add_argument("--lease", type=float, help="New lease length in seconds")
+
+    complete_parser = subparsers.add_parser("complete", help="Mark a task as done")
+    complete_parser.add_argument("task_id", help="Task id")
+    complete_parser.add_argument("--worker", help="Worker holding the lease")
+
+    replicate_parser = subparsers.add_parser("replicate", help="Sync a read replica from the change log")
+    replicate_parser.add_argument("--replica", help="Replica storage path")
+    replicate_parser.add_argument("--follow", action="store_true", help="Keep tailing the change log")
+    replicate_parser.add_argument("--interval", type=float, default=1.0, help="Poll interval in seconds")
+
+    tasks_parser = subparsers.add_parser("tasks", help="List queued and leased tasks")
+    tasks_parser.add_argument("--status", choices=["queued", "leased", "failed"],
+                              help="Only show tasks with this status")
+
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         return
 
+    if args.command == "replicate":
+        replica = BlackboardReplica(replica_path=args.replica)
+        while True:
+            applied = replica.sync()
+            lag = replica.lag()
+            print(f"Applied {applied} changes | cursor {lag['cursor_offset']}/{lag['log_bytes']} bytes "
+                  f"| pending {lag['pending_bytes']} | lag {lag['lag_seconds']:.1f}s")
+            if not args.follow:
+                return
+            time.sleep(args.interval)
+
     bb = ScholarStreamBlackboard()
 
     if args.command == "stats":
@@ -273,12 +937,61 @@ def main():
         print(f"Total Entries: {stats['total_entries']}")
         print(f"Knowledge Keys: {stats['knowledge_keys']}")
         print(f"Subscribers: {stats['subscribers']}")
+        cache = stats['query_cache']
+        print(f"Query Cache: {cache['size']}/{cache['capacity']} "
+              f"(hit rate {cache['hit_rate']:.1%}, {cache['hits']} hits, {cache['misses']} misses)")
         print("\nBy Agent:")
         for agent, count in stats['by_agent'].items():
             print(f"  {agent}: {count}")
         print("\nBy Type:")
         for entry_type, count in stats['by_type'].items():
             print(f"  {entry_type}: {count}")
+        queue = bb.queue_stats()
+        if queue:
+            print("\nTask Queue:")
+            for status, count in queue.items():
+                print(f"  {status}: {count}")
+
+    elif args.command == "evict":
+        removed = bb.evict_expired()
+        bb.save_now()
+        print(f"Evicted {removed} expired entries")
+
+    elif args.command == "enqueue":
+        try:
+            task = json.loads(args.task)
+        except json.JSONDecodeError:
+            task = args.task
+        task_id = bb.enqueue(task, priority=args.priority, agent=args.agent)
+        print(task_id)
+
+    elif args.command == "claim":
+        task = bb.claim(args.worker, args.lease)
+        if not task:
+            print("No tasks available")
+            sys.exit(1)
+        print(json.dumps(task, indent=2, default=str))
+
+    elif args.command == "heartbeat":
+        if not bb.heartbeat(args.task_id, args.worker, args.lease):
+            print(f"Task {args.task_id} is not leased by this worker")
+            sys.exit(1)
+        print(f"Extended lease on {args.task_id}")
+
+    elif args.command == "complete":
+        if not bb.complete(args.task_id, args.worker):
+            print(f"Task {args.task_id} could not be completed")
+            sys.exit(1)
+        print(f"Completed {args.task_id}")
+
+    elif args.command == "tasks":
+        tasks = bb.list_tasks(args.status)
+        print(f"\nTask Queue ({len(tasks)} tasks):")
+        print("=" * 40)
+        for task in tasks:
+            print(f"[{task['status']}] {task['id']} priority={task['priority']} "
+                  f"attempts={task['attempts']} worker={task['worker'] or '-'}")
+            print(f"  {task['task']}")
 
     elif args.command == "query":
         results = bb.query("cli", args.tags or [], max_results=args.max)
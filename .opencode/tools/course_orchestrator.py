@@ -2,13 +2,19 @@
 """Course Orchestrator - Supports course-master agent with configuration, validation, and progress tracking"""
 
 import argparse
+import hashlib
 import json
+import os
+import shlex
+import statistics
+import subprocess
 import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass, asdict, field
-from enum import Enum
 
 # Import existing tools
 tools_path = Path(__file__).parent
@@ -17,15 +23,7 @@ sys.path.insert(0, str(tools_path))
 from directory_manager import ScholarStreamDirectoryManager
 from url_validator import URLValidator
 from blackboard import ScholarStreamBlackboard
-
-
-class WeekStatus(Enum):
-    """Week generation status"""
-    PENDING = "pending"
-    PLANNING = "planning"
-    SLIDES = "slides"
-    COMPLETED = "completed"
-    FAILED = "failed"
+from progress_store import ProgressStore, WeekProgress, WeekStatus
 
 
 @dataclass
@@ -46,23 +44,205 @@ class WeekConfig:
         return asdict(self)
 
 
+def _digest(value) -> str:
+    """Stable SHA-256 of a JSON-serializable value"""
+    return hashlib.sha256(json.dumps(value, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def hash_files(directory: Path, pattern: str = "*") -> str:
+    """Content hash of the files matching pattern in directory (names included)"""
+    digest = hashlib.sha256()
+    if directory.exists():
+        for path in sorted(p for p in directory.glob(pattern) if p.is_file()):
+            digest.update(path.name.encode('utf-8') + b"\0")
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
 @dataclass
-class WeekProgress:
-    """Progress tracking for a single week"""
-    week: int
-    status: WeekStatus
-    research_completed: bool = False
-    slides_completed: bool = False
-    research_sections: int = 0
-    slide_pages: int = 0
-    errors: List[str] = field(default_factory=list)
-    started_at: Optional[str] = None
-    completed_at: Optional[str] = None
+class PipelineStep:
+    """One node of the pipeline DAG"""
+    key: str
+    # Called with the reasons the step is running; returns (status, message)
+    action: Callable[[List[str]], Tuple[str, str]]
+    deps: List[str] = field(default_factory=list)
+    # Named resource with a concurrency limit (e.g. 'agent', 'blackboard')
+    resource: Optional[str] = None
+    # Named input fingerprints, e.g. {'config': ..., 'plan': ...}
+    inputs: Optional[Callable[[], Dict[str, str]]] = None
+    # Fingerprint of what the step produces
+    outputs: Optional[Callable[[], str]] = None
+
+
+class PipelineExecutor:
+    """
+    Runs a DAG of steps on a thread pool, persisting each step's state
+
+    A step runs once all of its dependencies are done and a slot for its
+    resource is free. Actions return (status, message) where status is
+    'done', 'failed' or 'awaiting' (waiting on work outside the pipeline);
+    anything downstream of a step that is not done is left 'blocked'.
+
+    Like make, a step that finished before is skipped while its input
+    fingerprints, its upstream steps' fingerprints and its own outputs are
+    unchanged; otherwise the recorded reasons explain why it ran. An
+    interrupted build therefore resumes where it stopped.
+    """
+
+    def __init__(self, steps: List[PipelineStep], state_file: Path, workers: int = 4,
+                 resource_limits: Optional[Dict[str, int]] = None,
+                 on_step: Optional[Callable[[str, Dict], None]] = None):
+        self.steps = {step.key: step for step in steps}
+        self.state_file = state_file
+        self.workers = max(1, workers)
+        self.resource_limits = resource_limits or {}
+        # Called with (key, state record) after each step that ran
+        self.on_step = on_step
+
+    def run(self, force: bool = False) -> Dict[str, Dict]:
+        """
+        Execute every step that is out of date
 
-    def to_dict(self) -> Dict:
-        result = asdict(self)
-        result['status'] = self.status.value
-        return result
+        Args:
+            force: Run every step regardless of fingerprints
+
+        Returns:
+            Step key -> state record (status, reasons, message, timings, fingerprints)
+        """
+        state = self.load_state(self.state_file)
+        status = {key: 'pending' for key in self.steps}
+        in_use: Dict[str, int] = {}
+        running: Dict = {}
+        fingerprints: Dict[str, Dict[str, str]] = {}
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            while True:
+                progressed = True
+                while progressed:
+                    progressed = False
+                    for key, step in self.steps.items():
+                        if status[key] != 'pending' or any(status.get(dep) != 'done' for dep in step.deps):
+                            continue
+
+                        fingerprint = self._fingerprint(step, state)
+                        reasons = self._reasons(step, state.get(key, {}), fingerprint, force)
+                        if not reasons:
+                            status[key] = 'done'
+                            state[key]['skipped'] = True
+                            progressed = True
+                            continue
+
+                        if len(running) >= self.workers:
+                            continue
+                        if step.resource:
+                            limit = self.resource_limits.get(step.resource)
+                            if limit is not None and in_use.get(step.resource, 0) >= limit:
+                                continue
+                            in_use[step.resource] = in_use.get(step.resource, 0) + 1
+
+                        status[key] = 'running'
+                        state[key] = {
+                            **self._last_build(state.get(key, {})),
+                            'status': 'running',
+                            'reasons': reasons,
+                            'started_at': datetime.now().isoformat()
+                        }
+                        fingerprints[key] = fingerprint
+                        running[pool.submit(self._execute, step, reasons)] = key
+
+                if not running:
+                    break
+
+                self._save_state(state)
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    key = running.pop(future)
+                    step = self.steps[key]
+                    if step.resource and step.resource in in_use:
+                        in_use[step.resource] -= 1
+
+                    outcome, message, seconds = future.result()
+                    status[key] = outcome
+                    state[key].update({
+                        'status': outcome,
+                        'message': message,
+                        'finished_at': datetime.now().isoformat(),
+                        'seconds': round(seconds, 3),
+                        'skipped': False
+                    })
+                    # Fingerprints are only recorded for successful builds
+                    if outcome == 'done':
+                        state[key]['inputs'] = fingerprints[key]
+                        if step.outputs:
+                            state[key]['outputs'] = step.outputs()
+                    if self.on_step:
+                        self.on_step(key, state[key])
+                self._save_state(state)
+
+        for key, value in status.items():
+            if value == 'pending':
+                state[key] = {**self._last_build(state.get(key, {})), 'status': 'blocked'}
+        return {key: state[key] for key in self.steps}
+
+    @staticmethod
+    def _fingerprint(step: PipelineStep, state: Dict[str, Dict]) -> Dict[str, str]:
+        fingerprint = dict(step.inputs()) if step.inputs else {}
+        if step.deps:
+            # Upstream fingerprints and outputs, so a rebuilt dependency cascades
+            fingerprint['upstream'] = _digest([
+                [dep, state.get(dep, {}).get('inputs'), state.get(dep, {}).get('outputs')]
+                for dep in step.deps
+            ])
+        return fingerprint
+
+    @staticmethod
+    def _reasons(step: PipelineStep, previous: Dict, fingerprint: Dict[str, str],
+                 force: bool) -> List[str]:
+        """Why the step must run; empty when it is up to date"""
+        if force:
+            return ["forced"]
+        if 'inputs' not in previous:
+            return [f"previous run {previous['status']}"] if previous else ["never run"]
+
+        # Compared against the last successful build, so a step left awaiting
+        # or failed keeps the reasons it was started for
+        reasons = [] if previous.get('status') == 'done' else [f"previous run {previous.get('status')}"]
+        reasons += [
+            "upstream step changed" if name == 'upstream' else f"{name} changed"
+            for name, value in fingerprint.items() if previous['inputs'].get(name) != value
+        ]
+        if step.outputs and previous.get('outputs') != step.outputs():
+            reasons.append("outputs changed")
+        return reasons
+
+    @staticmethod
+    def _last_build(previous: Dict) -> Dict:
+        return {key: previous[key] for key in ('inputs', 'outputs') if key in previous}
+
+    @staticmethod
+    def _execute(step: PipelineStep, reasons: List[str]) -> Tuple[str, str, float]:
+        started = time.perf_counter()
+        try:
+            outcome, message = step.action(reasons)
+        except Exception as e:
+            outcome, message = 'failed', f"{type(e).__name__}: {e}"
+        return outcome, message, time.perf_counter() - started
+
+    @staticmethod
+    def load_state(state_file: Path) -> Dict[str, Dict]:
+        if not state_file.exists():
+            return {}
+        try:
+            return json.loads(state_file.read_text(encoding='utf-8'))
+        except Exception as e:
+            print(f"Warning: Failed to load pipeline state: {e}")
+            return {}
+
+    def _save_state(self, state: Dict[str, Dict]):
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_file.with_name(f".{self.state_file.name}.tmp")
+        tmp_path.write_text(json.dumps(state, indent=2), encoding='utf-8')
+        os.replace(tmp_path, self.state_file)
 
 
 class CourseOrchestrator:
@@ -74,6 +254,14 @@ class CourseOrchestrator:
         self.url_validator = URLValidator()
         self.blackboard = ScholarStreamBlackboard()
         self.progress_file = self.base_path / ".opencode" / "course_progress.json"
+        self.progress_store = ProgressStore(self.base_path / ".opencode" / "course_progress.sqlite3")
+        self.pipeline_state_file = self.base_path / ".opencode" / "pipeline_state.json"
+
+        # Progress used to live in course_progress.json; carry it over once
+        try:
+            self.progress_store.import_legacy(self.progress_file)
+        except ValueError as e:
+            print(f"Warning: {e} (file left in place; import will be retried)")
 
     def parse_text_config(self, text: str) -> List[WeekConfig]:
         """
@@ -306,6 +494,68 @@ class CourseOrchestrator:
 
         return result
 
+    def validate_all(self, weeks: Optional[List[int]] = None,
+                     workers: Optional[int] = None) -> Dict:
+        """
+        Validate planner and slides output of many weeks concurrently
+
+        Every (week, stage) check runs as its own job on a thread pool; the
+        checks are filesystem-bound, so threads overlap the I/O without the
+        startup cost of extra processes.
+
+        Args:
+            weeks: Week numbers to validate (default: every existing week)
+            workers: Thread pool size (default: one per job, capped at 32)
+
+        Returns:
+            Aggregated result with per-week planner/slides results and timings
+        """
+        if weeks is None:
+            weeks = [w['week'] for w in self.dir_manager.list_weeks()]
+        weeks = sorted(set(weeks))
+
+        stages = {
+            'planner': self.validate_planner_output,
+            'slides': self.validate_slides_output
+        }
+
+        def timed(stage: str, week_num: int) -> Dict:
+            started_at = datetime.now().isoformat()
+            started = time.perf_counter()
+            try:
+                result = stages[stage](week_num)
+            except Exception as e:
+                result = {'week': week_num, 'valid': False, 'issues': [f"Validation error: {e}"]}
+            result['seconds'] = round(time.perf_counter() - started, 4)
+            # Not 'validate_*': those are pipeline steps, whose latest spans feed the critical path
+            self.progress_store.record_span(week_num, f"check_{stage}", started_at, result['seconds'],
+                                            'done' if result['valid'] else 'failed')
+            return result
+
+        started = time.perf_counter()
+        jobs = [(week_num, stage) for week_num in weeks for stage in stages]
+        week_results = {week_num: {'week': week_num} for week_num in weeks}
+
+        if jobs:
+            with ThreadPoolExecutor(max_workers=workers or min(len(jobs), 32)) as pool:
+                futures = {job: pool.submit(timed, job[1], job[0]) for job in jobs}
+                for (week_num, stage), future in futures.items():
+                    week_results[week_num][stage] = future.result()
+
+        for result in week_results.values():
+            result['valid'] = all(result[stage]['valid'] for stage in stages)
+            result['seconds'] = round(sum(result[stage]['seconds'] for stage in stages), 4)
+
+        valid_weeks = sum(1 for r in week_results.values() if r['valid'])
+        return {
+            'valid': bool(weeks) and valid_weeks == len(weeks),
+            'total_weeks': len(weeks),
+            'valid_weeks': valid_weeks,
+            'invalid_weeks': len(weeks) - valid_weeks,
+            'seconds': round(time.perf_counter() - started, 4),
+            'weeks': [week_results[week_num] for week_num in weeks]
+        }
+
     def update_week_status(self, week_num: int, status: WeekStatus,
                           research_sections: int = 0, slide_pages: int = 0,
                           error: Optional[str] = None) -> Dict:
@@ -322,37 +572,238 @@ class CourseOrchestrator:
         Returns:
             Updated WeekProgress object
         """
-        progress = self._load_progress()
+        def apply(progress: WeekProgress):
+            progress.status = status
+
+            if status == WeekStatus.PLANNING:
+                if not progress.started_at:
+                    progress.started_at = datetime.now().isoformat()
+
+            elif status == WeekStatus.SLIDES:
+                progress.research_completed = True
+                progress.research_sections = research_sections
+
+            elif status == WeekStatus.COMPLETED:
+                progress.slides_completed = True
+                progress.slide_pages = slide_pages
+                progress.completed_at = datetime.now().isoformat()
+
+            elif status == WeekStatus.FAILED and error:
+                progress.errors.append(error)
+
+        # Read-modify-write of this week only, in one transaction
+        return self.progress_store.update(week_num, apply).to_dict()
+
+    # Per-week pipeline: step name -> dependencies (all within the same week)
+    PIPELINE_STEPS = {
+        'create_dir': [],
+        'init_blackboard': ['create_dir'],
+        'status_planning': ['create_dir'],
+        'planner': ['init_blackboard', 'status_planning'],
+        'validate_planner': ['planner'],
+        'status_slides': ['validate_planner'],
+        'slides': ['status_slides'],
+        'validate_slides': ['slides'],
+        'complete': ['validate_slides']
+    }
+
+    def build_pipeline(self, week_configs: List[WeekConfig],
+                       planner_cmd: Optional[str] = None,
+                       slides_cmd: Optional[str] = None) -> List[PipelineStep]:
+        """
+        Build the pipeline DAG for the given weeks
 
-        if week_num not in progress:
-            progress[week_num] = WeekProgress(
-                week=week_num,
-                status=WeekStatus.PENDING
-            )
+        Weeks share no dependencies, so they run concurrently. Agent steps
+        run planner_cmd/slides_cmd, formatted with the week's configuration
+        ({week}, {week:02d}, {topic}, {hours}, {audience}, {direction},
+        {emphasis}; text values are shell-quoted). Without a command an
+        agent step is 'awaiting' until its output validates.
 
-        # Update status
-        progress[week_num].status = status
+        Each step is fingerprinted by the week config (WeekConfig.to_dict())
+        and the plan/slides files it reads, so editing one week's config only
+        rebuilds that week's config-dependent steps and what follows them.
 
-        if status == WeekStatus.PLANNING:
-            if not progress[week_num].started_at:
-                progress[week_num].started_at = datetime.now().isoformat()
+        Returns:
+            List of PipelineStep keyed 'weekXX:step'
+        """
+        steps = []
+        for config in sorted(week_configs, key=lambda w: w.week):
+            week = config.week
+            week_dir = self.base_path / f"week{week:02d}"
+            actions = {
+                'create_dir': lambda r, c=config: self._step_create_dir(c),
+                'init_blackboard': lambda r, c=config: self._step_init_blackboard(c),
+                'status_planning': lambda r, w=week: self._step_status(w, WeekStatus.PLANNING),
+                'planner': lambda r, c=config: self._step_agent(c, planner_cmd, self.validate_planner_output, r),
+                'validate_planner': lambda r, w=week: self._step_validate(w, self.validate_planner_output),
+                'status_slides': lambda r, w=week: self._step_status(w, WeekStatus.SLIDES),
+                'slides': lambda r, c=config: self._step_agent(c, slides_cmd, self.validate_slides_output, r),
+                'validate_slides': lambda r, w=week: self._step_validate(w, self.validate_slides_output),
+                'complete': lambda r, w=week: self._step_status(w, WeekStatus.COMPLETED)
+            }
+            resources = {'init_blackboard': 'blackboard', 'planner': 'agent', 'slides': 'agent'}
+
+            config_hash = _digest(config.to_dict())
+            plan_hash = lambda d=week_dir: hash_files(d / "plan", "*.md")
+            slides_hash = lambda d=week_dir: hash_files(d / "slides")
+            inputs = {
+                'init_blackboard': lambda h=config_hash: {'config': h},
+                'status_planning': lambda h=config_hash: {'config': h},
+                'planner': lambda h=config_hash: {'config': h},
+                'validate_planner': lambda f=plan_hash: {'plan': f()},
+                'status_slides': lambda f=plan_hash: {'plan': f()},
+                'slides': lambda h=config_hash, f=plan_hash: {'config': h, 'plan': f()},
+                'validate_slides': lambda f=slides_hash: {'slides': f()},
+                'complete': lambda f=slides_hash: {'slides': f()}
+            }
+            outputs = {
+                'create_dir': lambda d=week_dir: _digest(
+                    [name for name in ("plan", "slides", "assignments", "assets") if (d / name).is_dir()]
+                ),
+                'planner': plan_hash,
+                'slides': slides_hash
+            }
 
-        elif status == WeekStatus.SLIDES:
-            progress[week_num].research_completed = True
-            progress[week_num].research_sections = research_sections
+            for name, deps in self.PIPELINE_STEPS.items():
+                steps.append(PipelineStep(
+                    key=f"week{week:02d}:{name}",
+                    action=actions[name],
+                    deps=[f"week{week:02d}:{dep}" for dep in deps],
+                    resource=resources.get(name),
+                    inputs=inputs.get(name),
+                    outputs=outputs.get(name)
+                ))
+        return steps
+
+    def run_pipeline(self, week_configs: List[WeekConfig], workers: int = 4,
+                     planner_cmd: Optional[str] = None, slides_cmd: Optional[str] = None,
+                     max_agents: Optional[int] = None, reset: bool = False,
+                     force: bool = False) -> Dict:
+        """
+        Build all weeks through the pipeline, resuming from saved step state
 
-        elif status == WeekStatus.COMPLETED:
-            progress[week_num].slides_completed = True
-            progress[week_num].slide_pages = slide_pages
-            progress[week_num].completed_at = datetime.now().isoformat()
+        Args:
+            week_configs: Weeks to build
+            workers: Steps run at once across all weeks
+            planner_cmd: Command template for the planner step
+            slides_cmd: Command template for the slides step
+            max_agents: Agent steps run at once (default: workers)
+            reset: Forget saved step state for these weeks first
+            force: Run every step even when its fingerprints are unchanged
+
+        Returns:
+            Dictionary with per-week outcome, step states and total seconds
+        """
+        steps = self.build_pipeline(week_configs, planner_cmd, slides_cmd)
+
+        if reset:
+            state = PipelineExecutor.load_state(self.pipeline_state_file)
+            keys = {step.key for step in steps}
+            kept = {key: value for key, value in state.items() if key not in keys}
+            self.pipeline_state_file.parent.mkdir(parents=True, exist_ok=True)
+            self.pipeline_state_file.write_text(json.dumps(kept, indent=2), encoding='utf-8')
+
+        def record_span(key: str, record: Dict):
+            week, step = key.split(':', 1)
+            self.progress_store.record_span(int(week[len('week'):]), step, record['started_at'],
+                                            record['seconds'], record['status'], record.get('message'))
+
+        executor = PipelineExecutor(
+            steps, self.pipeline_state_file, workers,
+            # Blackboard init loads and rewrites the whole board, so it runs alone
+            resource_limits={'agent': max_agents or workers, 'blackboard': 1},
+            on_step=record_span
+        )
+
+        started = time.perf_counter()
+        states = executor.run(force=force)
+
+        weeks = {}
+        for config in sorted(week_configs, key=lambda w: w.week):
+            prefix = f"week{config.week:02d}:"
+            week_steps = {key[len(prefix):]: value for key, value in states.items() if key.startswith(prefix)}
+            outcomes = {value['status'] for value in week_steps.values()}
+            if outcomes == {'done'}:
+                outcome = 'completed'
+            elif 'failed' in outcomes:
+                outcome = 'failed'
+            elif 'awaiting' in outcomes:
+                outcome = 'awaiting'
+            else:
+                outcome = 'incomplete'
+            weeks[config.week] = {'outcome': outcome, 'steps': week_steps}
+
+        return {
+            'completed': all(w['outcome'] == 'completed' for w in weeks.values()),
+            'seconds': round(time.perf_counter() - started, 3),
+            'weeks': weeks
+        }
+
+    def _step_create_dir(self, config: WeekConfig) -> Tuple[str, str]:
+        result = self.dir_manager.create_week_structure(config.week)
+        return 'done', result.get('message', result['status'])
 
-        elif status == WeekStatus.FAILED and error:
-            progress[week_num].errors.append(error)
+    def _step_init_blackboard(self, config: WeekConfig) -> Tuple[str, str]:
+        from init_week_blackboard import init_week_blackboard
 
-        # Save to file
-        self._save_progress(progress)
+        ok = init_week_blackboard(
+            week_num=config.week,
+            topic=config.topic,
+            duration=config.hours,
+            audience=config.audience,
+            direction=config.direction,
+            emphasis=config.emphasis
+        )
+        return ('done', "Blackboard initialized") if ok else ('failed', "Blackboard initialization failed")
 
-        return progress[week_num].to_dict()
+    def _step_status(self, week_num: int, status: WeekStatus) -> Tuple[str, str]:
+        sections = pages = 0
+        week_dir = self.base_path / f"week{week_num:02d}"
+        if status == WeekStatus.SLIDES:
+            sections = len(list((week_dir / "plan").glob("section_*_research.md")))
+        elif status == WeekStatus.COMPLETED:
+            slides_md = week_dir / "slides" / f"week{week_num:02d}_slides.md"
+            if slides_md.exists():
+                pages = sum(1 for line in slides_md.read_text(encoding='utf-8').splitlines()
+                            if line.startswith('---'))
+        self.update_week_status(week_num, status, research_sections=sections, slide_pages=pages)
+        return 'done', f"Status set to {status.value}"
+
+    def _step_agent(self, config: WeekConfig, command: Optional[str],
+                    validate: Callable[[int], Dict], reasons: List[str]) -> Tuple[str, str]:
+        # Output edited or regenerated outside the pipeline is adopted rather than
+        # overwritten, unless the inputs it was built from have changed since
+        stale = [r for r in reasons if r.endswith(" changed") and r != "outputs changed"]
+        edited = "outputs changed" in reasons
+        if not command or (edited and not stale and "forced" not in reasons):
+            if validate(config.week)['valid']:
+                if not stale:
+                    return 'done', "Updated output adopted" if edited else "Output already present"
+                if edited:
+                    return 'done', "Regenerated output adopted"
+            if not command:
+                if stale:
+                    return 'awaiting', f"Inputs changed ({', '.join(stale)}); re-run the agent and resume"
+                return 'awaiting', "No command configured; run the agent and resume"
+
+        values = {key: value if isinstance(value, (int, float)) else shlex.quote(str(value))
+                  for key, value in config.to_dict().items()}
+        completed = subprocess.run(command.format(**values), shell=True, cwd=self.base_path,
+                                   capture_output=True, text=True)
+        if completed.returncode != 0:
+            tail = (completed.stderr or completed.stdout).strip().splitlines()[-1:] or [""]
+            message = f"Exit code {completed.returncode}: {tail[0]}"
+            self.update_week_status(config.week, WeekStatus.FAILED, error=message)
+            return 'failed', message
+        return 'done', "Agent command finished"
+
+    def _step_validate(self, week_num: int, validate: Callable[[int], Dict]) -> Tuple[str, str]:
+        result = validate(week_num)
+        if result['valid']:
+            return 'done', "Output valid"
+        message = "; ".join(result['issues'])
+        self.update_week_status(week_num, WeekStatus.FAILED, error=message)
+        return 'failed', message
 
     def generate_progress_report(self, week_configs: List[WeekConfig]) -> str:
         """
@@ -425,6 +876,8 @@ class CourseOrchestrator:
 
             report.append("")
 
+        report.extend(self._timing_report([w.week for w in week_configs]))
+
         # Output locations
         report.append(f"## Output Locations")
         report.append("")
@@ -440,6 +893,71 @@ class CourseOrchestrator:
 
         return "\n".join(report)
 
+    def _timing_report(self, week_nums: List[int]) -> List[str]:
+        """
+        Build-timing section of the progress report
+
+        Uses the latest span of each (week, step): per-step duration
+        distribution across weeks, the slowest weeks, and the critical path
+        through PIPELINE_STEPS. Weeks build concurrently, so the slowest
+        week's critical path bounds the course build time.
+        """
+        spans = self.progress_store.spans(week_nums, latest=True) if week_nums else []
+        if not spans:
+            return []
+
+        durations: Dict[int, Dict[str, float]] = {}
+        for span in spans:
+            durations.setdefault(span['week'], {})[span['step']] = span['duration']
+
+        def critical_path(week_num: int) -> Tuple[float, List[str]]:
+            longest: Dict[str, Tuple[float, List[str]]] = {}
+            for step, deps in self.PIPELINE_STEPS.items():  # already in dependency order
+                before = max((longest[dep] for dep in deps), default=(0.0, []))
+                longest[step] = (before[0] + durations[week_num].get(step, 0.0), before[1] + [step])
+            return max(longest.values())
+
+        steps = [step for step in self.PIPELINE_STEPS if any(step in d for d in durations.values())]
+        steps += sorted({span['step'] for span in spans} - set(steps))
+
+        report = [f"## Build Timing", ""]
+        report.append("### Step Durations (latest run per week)")
+        report.append("")
+        report.append("| Step | Weeks | Median | Mean | Max | Total |")
+        report.append("|------|-------|--------|------|-----|-------|")
+        for step in steps:
+            values = {week_num: d[step] for week_num, d in durations.items() if step in d}
+            slowest = max(values, key=values.get)
+            report.append(
+                f"| {step} | {len(values)} | {statistics.median(values.values()):.1f}s "
+                f"| {statistics.mean(values.values()):.1f}s "
+                f"| {values[slowest]:.1f}s (week {slowest:02d}) | {sum(values.values()):.1f}s |"
+            )
+        report.append("")
+
+        paths = {week_num: critical_path(week_num) for week_num in durations}
+        report.append("### Slowest Weeks")
+        report.append("")
+        report.append("| Week | Total | Critical Path | Slowest Step |")
+        report.append("|------|-------|---------------|--------------|")
+        ranked = sorted(durations, key=lambda w: sum(durations[w].values()), reverse=True)
+        for week_num in ranked[:5]:
+            step = max(durations[week_num], key=durations[week_num].get)
+            report.append(
+                f"| {week_num:02d} | {sum(durations[week_num].values()):.1f}s "
+                f"| {paths[week_num][0]:.1f}s | {step} ({durations[week_num][step]:.1f}s) |"
+            )
+        report.append("")
+
+        week_num = max(paths, key=lambda w: paths[w][0])
+        length, path = paths[week_num]
+        report.append("### Critical Path")
+        report.append("")
+        report.append(f"Week {week_num:02d}, {length:.1f}s:")
+        report.append(" → ".join(f"{step} ({durations[week_num].get(step, 0.0):.1f}s)" for step in path))
+        report.append("")
+        return report
+
     def generate_agent_commands(self, week_configs: List[WeekConfig]) -> str:
         """
         Generate sequential commands for course-master agent to execute
@@ -551,46 +1069,8 @@ class CourseOrchestrator:
         return "\n".join(commands)
 
     def _load_progress(self) -> Dict[int, WeekProgress]:
-        """Load progress from file"""
-        if not self.progress_file.exists():
-            return {}
-
-        try:
-            data = json.loads(self.progress_file.read_text(encoding='utf-8'))
-            progress = {}
-
-            for week_num, prog_data in data.items():
-                progress[int(week_num)] = WeekProgress(
-                    week=int(week_num),
-                    status=WeekStatus(prog_data['status']),
-                    research_completed=prog_data.get('research_completed', False),
-                    slides_completed=prog_data.get('slides_completed', False),
-                    research_sections=prog_data.get('research_sections', 0),
-                    slide_pages=prog_data.get('slide_pages', 0),
-                    errors=prog_data.get('errors', []),
-                    started_at=prog_data.get('started_at'),
-                    completed_at=prog_data.get('completed_at')
-                )
-
-            return progress
-
-        except Exception as e:
-            print(f"Warning: Failed to load progress file: {e}")
-            return {}
-
-    def _save_progress(self, progress: Dict[int, WeekProgress]):
-        """Save progress to file"""
-        try:
-            data = {
-                str(week_num): prog.to_dict()
-                for week_num, prog in progress.items()
-            }
-
-            self.progress_file.parent.mkdir(parents=True, exist_ok=True)
-            self.progress_file.write_text(json.dumps(data, indent=2), encoding='utf-8')
-
-        except Exception as e:
-            print(f"Warning: Failed to save progress file: {e}")
+        """Load progress for all weeks"""
+        return self.progress_store.load()
 
 
 def main():
@@ -625,6 +1105,13 @@ def main():
     validate_slides_parser = subparsers.add_parser("validate-slides", help="Validate slides output")
     validate_slides_parser.add_argument("--week", type=int, required=True, help="Week number")
 
+    # Validate every week
+    validate_all_parser = subparsers.add_parser("validate-all", help="Validate planner and slides output of all weeks")
+    validate_all_parser.add_argument("--weeks", help="Comma-separated week numbers (default: all existing weeks)")
+    validate_all_parser.add_argument("--config", help="Validate the weeks in this configuration file (JSON or text)")
+    validate_all_parser.add_argument("--workers", type=int, help="Thread pool size")
+    validate_all_parser.add_argument("--json", action="store_true", help="Print the aggregated result as JSON")
+
     # Update status
     update_status_parser = subparsers.add_parser("update-status", help="Update week status")
     update_status_parser.add_argument("--week", type=int, required=True, help="Week number")
@@ -641,6 +1128,24 @@ def main():
     commands_parser = subparsers.add_parser("commands", help="Generate execution commands")
     commands_parser.add_argument("--config", help="Path to configuration file (JSON or text)")
 
+    # Run the pipeline
+    pipeline_parser = subparsers.add_parser("pipeline", help="Build weeks concurrently through the step DAG")
+    pipeline_parser.add_argument("--config", required=True, help="Path to configuration file (JSON or text)")
+    pipeline_parser.add_argument("--workers", type=int, default=4, help="Steps run at once across all weeks")
+    pipeline_parser.add_argument("--max-agents", type=int, help="Agent steps run at once (default: workers)")
+    pipeline_parser.add_argument("--planner-cmd", help="Command template for the planner step, e.g. "
+                                 "\"opencode run --agent planner 'week {week}: {topic}'\"")
+    pipeline_parser.add_argument("--slides-cmd", help="Command template for the slides step")
+    pipeline_parser.add_argument("--reset", action="store_true", help="Discard saved step state and start over")
+    pipeline_parser.add_argument("--force", action="store_true", help="Run every step even if it is up to date")
+    pipeline_parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+
+    # Time a tool step
+    time_step_parser = subparsers.add_parser("time-step", help="Run a command and record its duration as a step span")
+    time_step_parser.add_argument("--week", type=int, required=True, help="Week number")
+    time_step_parser.add_argument("--step", required=True, help="Step name, e.g. url_validation, mermaid, marp_export")
+    time_step_parser.add_argument("cmd", nargs=argparse.REMAINDER, help="Command to run (after --)")
+
     # Show progress
     show_parser = subparsers.add_parser("show", help="Show current progress")
 
@@ -701,6 +1206,36 @@ def main():
             for issue in result['issues']:
                 print(f"  - {issue}")
 
+    elif args.command == "validate-all":
+        weeks = None
+        if args.weeks:
+            weeks = [int(w) for w in args.weeks.split(',') if w.strip()]
+        elif args.config:
+            config_path = Path(args.config)
+            if config_path.suffix == '.json':
+                configs = orchestrator.parse_json_config(config_path.read_text(encoding='utf-8'))
+            else:
+                configs = orchestrator.parse_text_config(config_path.read_text(encoding='utf-8'))
+            weeks = [c.week for c in configs]
+
+        result = orchestrator.validate_all(weeks, args.workers)
+
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            print(f"Validated {result['total_weeks']} weeks in {result['seconds']:.3f}s: "
+                  f"{result['valid_weeks']} valid, {result['invalid_weeks']} with issues")
+            for week_result in result['weeks']:
+                icon = "✓" if week_result['valid'] else "✗"
+                print(f"{icon} Week {week_result['week']:02d} ({week_result['seconds'] * 1000:.1f} ms)")
+                for stage in ('planner', 'slides'):
+                    stage_result = week_result[stage]
+                    for issue in stage_result['issues']:
+                        print(f"  - {stage}: {issue}")
+
+        # 0: all valid, 1: some week has issues, 2: nothing to validate
+        sys.exit(0 if result['valid'] else (1 if result['total_weeks'] else 2))
+
     elif args.command == "update-status":
         status_map = {
             "pending": WeekStatus.PENDING,
@@ -718,6 +1253,18 @@ def main():
         )
         print(f"✓ Updated week {args.week} status to {args.status}")
 
+    elif args.command == "time-step":
+        cmd = args.cmd[1:] if args.cmd[:1] == ["--"] else args.cmd
+        if not cmd:
+            print("❌ No command given")
+            sys.exit(2)
+
+        with orchestrator.progress_store.span(args.week, args.step) as span:
+            returncode = subprocess.call(cmd)
+            if returncode != 0:
+                span['outcome'], span['detail'] = 'failed', f"Exit code {returncode}"
+        sys.exit(returncode)
+
     elif args.command == "report":
         # Load configuration
         weeks = []
@@ -744,6 +1291,41 @@ def main():
         commands = orchestrator.generate_agent_commands(weeks)
         print(commands)
 
+    elif args.command == "pipeline":
+        config_path = Path(args.config)
+        if config_path.suffix == '.json':
+            weeks = orchestrator.parse_json_config(config_path.read_text(encoding='utf-8'))
+        else:
+            weeks = orchestrator.parse_text_config(config_path.read_text(encoding='utf-8'))
+
+        result = orchestrator.run_pipeline(
+            weeks,
+            workers=args.workers,
+            planner_cmd=args.planner_cmd,
+            slides_cmd=args.slides_cmd,
+            max_agents=args.max_agents,
+            reset=args.reset,
+            force=args.force
+        )
+
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            icons = {'completed': "✅", 'failed': "❌", 'awaiting': "⏸", 'incomplete': "⏳"}
+            print(f"Pipeline finished in {result['seconds']:.1f}s")
+            for week_num, week in result['weeks'].items():
+                skipped = sum(1 for step in week['steps'].values() if step.get('skipped'))
+                up_to_date = f" ({skipped} up to date)" if skipped else ""
+                print(f"{icons.get(week['outcome'], '❓')} Week {week_num:02d}: {week['outcome']}{up_to_date}")
+                for name, step in week['steps'].items():
+                    if step.get('skipped'):
+                        continue
+                    reasons = f" [{', '.join(step['reasons'])}]" if step.get('reasons') else ""
+                    message = f" - {step['message']}" if step.get('message') else ""
+                    print(f"  {name}: {step['status']}{reasons}{message}")
+
+        sys.exit(0 if result['completed'] else 1)
+
     elif args.command == "show":
         progress = orchestrator._load_progress()
         print("\nCurrent Progress:")
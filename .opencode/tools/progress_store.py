@@ -0,0 +1,424 @@
+#!/usr/bin/env python3
+"""Progress Store for ScholarStream - Transactional per-week progress tracking"""
+import argparse
+import json
+import sqlite3
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+class WeekStatus(Enum):
+    """Week generation status"""
+    PENDING = "pending"
+    PLANNING = "planning"
+    SLIDES = "slides"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class WeekProgress:
+    """Progress tracking for a single week"""
+    week: int
+    status: WeekStatus
+    research_completed: bool = False
+    slides_completed: bool = False
+    research_sections: int = 0
+    slide_pages: int = 0
+    errors: List[str] = field(default_factory=list)
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+    # Status changes in order: {'from': ..., 'to': ..., 'at': ...}
+    transitions: List[Dict] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        result = asdict(self)
+        result['status'] = self.status.value
+        return result
+
+
+class ProgressStore:
+    """
+    SQLite-backed course progress, updated one week at a time
+
+    Every update is a single IMMEDIATE transaction on that week's row, so
+    concurrent processes and pipeline threads serialize on the database
+    lock instead of overwriting each other's copy of the whole file.
+    Each status change is also recorded with its timestamp, and build
+    steps record timing spans (start, end, duration, outcome).
+    """
+
+    DEFAULT_PATH = ".opencode/course_progress.sqlite3"
+
+    def __init__(self, path: Optional[str] = None, timeout: float = 30.0):
+        """
+        Args:
+            path: SQLite database file
+            timeout: Seconds to wait for another writer's lock
+        """
+        self.path = Path(path or self.DEFAULT_PATH)
+        self.timeout = timeout
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS weeks (
+                    week INTEGER PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    research_completed INTEGER NOT NULL DEFAULT 0,
+                    slides_completed INTEGER NOT NULL DEFAULT 0,
+                    research_sections INTEGER NOT NULL DEFAULT 0,
+                    slide_pages INTEGER NOT NULL DEFAULT 0,
+                    started_at TEXT,
+                    completed_at TEXT,
+                    updated_at TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS errors (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    week INTEGER NOT NULL,
+                    message TEXT NOT NULL,
+                    recorded_at TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_errors_week ON errors(week, id);
+
+                CREATE TABLE IF NOT EXISTS transitions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    week INTEGER NOT NULL,
+                    from_status TEXT,
+                    to_status TEXT NOT NULL,
+                    at TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_transitions_week ON transitions(week, id);
+
+                CREATE TABLE IF NOT EXISTS spans (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    week INTEGER NOT NULL,
+                    step TEXT NOT NULL,
+                    started_at TEXT NOT NULL,
+                    ended_at TEXT NOT NULL,
+                    duration REAL NOT NULL,
+                    outcome TEXT NOT NULL,
+                    detail TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_spans_week ON spans(week, step, id);
+
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
+
+    @contextmanager
+    def _connect(self):
+        """Short-lived connection, so the store is safe across threads and processes"""
+        conn = sqlite3.connect(str(self.path), timeout=self.timeout, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        """Write transaction holding the database lock from the first read"""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def get(self, week: int) -> Optional[WeekProgress]:
+        """Progress for one week, or None if it has never been updated"""
+        with self._connect() as conn:
+            return self._read(conn, [week]).get(week)
+
+    def load(self) -> Dict[int, WeekProgress]:
+        """Progress for every tracked week"""
+        with self._connect() as conn:
+            return self._read(conn)
+
+    def update(self, week: int, mutate: Callable[[WeekProgress], None]) -> WeekProgress:
+        """
+        Apply mutate to one week's progress atomically
+
+        Args:
+            week: Week number
+            mutate: Modifies the WeekProgress in place (a new week starts as PENDING)
+
+        Returns:
+            The updated WeekProgress
+        """
+        now = datetime.now().isoformat()
+        with self._transaction() as conn:
+            progress = self._read(conn, [week]).get(week)
+            previous = progress.status if progress else None
+            known_errors = len(progress.errors) if progress else 0
+            progress = progress or WeekProgress(week=week, status=WeekStatus.PENDING)
+
+            mutate(progress)
+
+            conn.execute("""
+                INSERT INTO weeks (week, status, research_completed, slides_completed,
+                                   research_sections, slide_pages, started_at, completed_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(week) DO UPDATE SET
+                    status = excluded.status,
+                    research_completed = excluded.research_completed,
+                    slides_completed = excluded.slides_completed,
+                    research_sections = excluded.research_sections,
+                    slide_pages = excluded.slide_pages,
+                    started_at = excluded.started_at,
+                    completed_at = excluded.completed_at,
+                    updated_at = excluded.updated_at
+            """, (week, progress.status.value, int(progress.research_completed),
+                  int(progress.slides_completed), progress.research_sections,
+                  progress.slide_pages, progress.started_at, progress.completed_at, now))
+
+            conn.executemany(
+                "INSERT INTO errors (week, message, recorded_at) VALUES (?, ?, ?)",
+                [(week, message, now) for message in progress.errors[known_errors:]]
+            )
+
+            if progress.status != previous:
+                conn.execute(
+                    "INSERT INTO transitions (week, from_status, to_status, at) VALUES (?, ?, ?, ?)",
+                    (week, previous.value if previous else None, progress.status.value, now)
+                )
+                progress.transitions.append({
+                    'from': previous.value if previous else None,
+                    'to': progress.status.value,
+                    'at': now
+                })
+
+        return progress
+
+    def record_span(self, week: int, step: str, started_at: str, duration: float,
+                    outcome: str, detail: Optional[str] = None):
+        """
+        Record one timed step of a week's build
+
+        Args:
+            week: Week number
+            step: Step name (pipeline step or tool, e.g. 'planner', 'marp_export')
+            started_at: ISO timestamp the step started
+            duration: Seconds the step took
+            outcome: 'done', 'failed', 'awaiting', ...
+            detail: Optional message
+        """
+        ended_at = (datetime.fromisoformat(started_at) + timedelta(seconds=duration)).isoformat()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO spans (week, step, started_at, ended_at, duration, outcome, detail) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (week, step, started_at, ended_at, duration, outcome, detail)
+            )
+
+    @contextmanager
+    def span(self, week: int, step: str):
+        """
+        Time a block as a step span
+
+        Yields a dict whose 'outcome' (default 'done') and 'detail' the
+        block may set; an exception records the span as 'failed'.
+        """
+        started_at = datetime.now().isoformat()
+        started = time.perf_counter()
+        record = {'outcome': 'done', 'detail': None}
+        try:
+            yield record
+        except BaseException as e:
+            record['outcome'], record['detail'] = 'failed', f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self.record_span(week, step, started_at, time.perf_counter() - started,
+                             record['outcome'], record['detail'])
+
+    def spans(self, weeks: Optional[List[int]] = None, latest: bool = False) -> List[Dict]:
+        """
+        Recorded step spans, oldest first
+
+        Args:
+            weeks: Only these weeks (default: all)
+            latest: Only the most recent span of each (week, step)
+
+        Returns:
+            List of span dictionaries
+        """
+        where, params = [], []
+        if weeks is not None:
+            where.append(f"week IN ({', '.join('?' * len(weeks))})")
+            params = list(weeks)
+        if latest:
+            where.append("id IN (SELECT MAX(id) FROM spans GROUP BY week, step)")
+        clause = f" WHERE {' AND '.join(where)}" if where else ""
+
+        with self._connect() as conn:
+            return [dict(row) for row in conn.execute(f"SELECT * FROM spans{clause} ORDER BY id", params)]
+
+    def import_legacy(self, json_path: Path) -> int:
+        """
+        One-time import of a course_progress.json written by older versions
+
+        Weeks already in the store are left alone. The JSON file is not
+        modified; if it cannot be parsed a ValueError is raised and nothing
+        is marked imported, so the import is retried once it is fixed.
+
+        Returns:
+            Number of weeks imported
+        """
+        json_path = Path(json_path)
+        if not json_path.exists():
+            return 0
+
+        with self._transaction() as conn:
+            marker = conn.execute("SELECT value FROM meta WHERE key = 'legacy_import'").fetchone()
+            if marker:
+                return 0
+
+            try:
+                data = json.loads(json_path.read_text(encoding='utf-8'))
+                weeks = [
+                    WeekProgress(
+                        week=int(week_num),
+                        status=WeekStatus(prog_data['status']),
+                        research_completed=prog_data.get('research_completed', False),
+                        slides_completed=prog_data.get('slides_completed', False),
+                        research_sections=prog_data.get('research_sections', 0),
+                        slide_pages=prog_data.get('slide_pages', 0),
+                        errors=prog_data.get('errors', []),
+                        started_at=prog_data.get('started_at'),
+                        completed_at=prog_data.get('completed_at')
+                    )
+                    for week_num, prog_data in data.items()
+                ]
+            except Exception as e:
+                raise ValueError(f"Cannot import {json_path}: {e}") from e
+
+            existing = {row['week'] for row in conn.execute("SELECT week FROM weeks")}
+            imported = 0
+            for prog in weeks:
+                if prog.week in existing:
+                    continue
+                at = prog.completed_at or prog.started_at or datetime.now().isoformat()
+                conn.execute("""
+                    INSERT INTO weeks (week, status, research_completed, slides_completed,
+                                       research_sections, slide_pages, started_at, completed_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (prog.week, prog.status.value, int(prog.research_completed),
+                      int(prog.slides_completed), prog.research_sections, prog.slide_pages,
+                      prog.started_at, prog.completed_at, at))
+                conn.executemany(
+                    "INSERT INTO errors (week, message, recorded_at) VALUES (?, ?, ?)",
+                    [(prog.week, message, at) for message in prog.errors]
+                )
+                # The legacy file only kept the current status
+                conn.execute(
+                    "INSERT INTO transitions (week, from_status, to_status, at) VALUES (?, NULL, ?, ?)",
+                    (prog.week, prog.status.value, at)
+                )
+                imported += 1
+
+            conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('legacy_import', ?)",
+                (json.dumps({'path': str(json_path), 'weeks': imported,
+                             'at': datetime.now().isoformat()}),)
+            )
+        return imported
+
+    @staticmethod
+    def _read(conn: sqlite3.Connection, weeks: Optional[List[int]] = None) -> Dict[int, WeekProgress]:
+        where, params = "", []
+        if weeks is not None:
+            where = f" WHERE week IN ({', '.join('?' * len(weeks))})"
+            params = list(weeks)
+
+        progress = {
+            row['week']: WeekProgress(
+                week=row['week'],
+                status=WeekStatus(row['status']),
+                research_completed=bool(row['research_completed']),
+                slides_completed=bool(row['slides_completed']),
+                research_sections=row['research_sections'],
+                slide_pages=row['slide_pages'],
+                started_at=row['started_at'],
+                completed_at=row['completed_at']
+            )
+            for row in conn.execute(f"SELECT * FROM weeks{where}", params)
+        }
+        for row in conn.execute(f"SELECT week, message FROM errors{where} ORDER BY id", params):
+            if row['week'] in progress:
+                progress[row['week']].errors.append(row['message'])
+        for row in conn.execute(f"SELECT * FROM transitions{where} ORDER BY id", params):
+            if row['week'] in progress:
+                progress[row['week']].transitions.append(
+                    {'from': row['from_status'], 'to': row['to_status'], 'at': row['at']}
+                )
+        return progress
+
+
+def main():
+    """CLI entry point"""
+    parser = argparse.ArgumentParser(
+        description="ScholarStream Progress Store"
+    )
+    parser.add_argument("--db", default=ProgressStore.DEFAULT_PATH, help="Progress database")
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    history_parser = subparsers.add_parser("history", help="Show status transitions")
+    history_parser.add_argument("--week", type=int, help="Only this week")
+
+    spans_parser = subparsers.add_parser("spans", help="Show recorded step timings")
+    spans_parser.add_argument("--week", type=int, help="Only this week")
+    spans_parser.add_argument("--latest", action="store_true", help="Only the latest span per step")
+
+    import_parser = subparsers.add_parser("import", help="Import a legacy course_progress.json")
+    import_parser.add_argument("json_file", help="Path to course_progress.json")
+
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    store = ProgressStore(args.db)
+
+    if args.command == "history":
+        progress = store.load()
+        weeks = [args.week] if args.week is not None else sorted(progress)
+        for week_num in weeks:
+            if week_num not in progress:
+                print(f"Week {week_num:02d}: no progress tracked")
+                continue
+            print(f"Week {week_num:02d}: {progress[week_num].status.value}")
+            for transition in progress[week_num].transitions:
+                print(f"  {transition['at']}  {transition['from'] or '-'} -> {transition['to']}")
+
+    elif args.command == "spans":
+        weeks = [args.week] if args.week is not None else None
+        for span in store.spans(weeks, latest=args.latest):
+            detail = f" - {span['detail']}" if span['detail'] else ""
+            print(f"Week {span['week']:02d} {span['step']:<20} {span['duration']:8.2f}s "
+                  f"{span['outcome']:<9} {span['started_at']}{detail}")
+
+    elif args.command == "import":
+        try:
+            imported = store.import_legacy(Path(args.json_file))
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        print(f"Imported {imported} weeks")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""Reference Database for ScholarStream - Course-wide index of cited URLs and their link health"""
+import argparse
+import asyncio
+import hashlib
+import json
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+from url_validator import (URLCanonicalizer, URLCheckResult, URLValidationCache, URLValidator,
+                           extract_links)
+
+
+WEEK_DIR_RE = re.compile(r'^week(\d+)$')
+
+
+class ReferenceDatabase:
+    """
+    Persistent SQLite index of every URL cited across the course
+
+    Records where each URL is cited (week, file, line), its canonical form
+    and host, and every verdict it has received, so course-wide audits are
+    index lookups rather than a re-crawl of every week.
+    """
+
+    DEFAULT_PATH = ".opencode/references.sqlite3"
+
+    # Statuses that count as broken in audits
+    BROKEN_STATUSES = ("invalid",)
+
+    def __init__(self, path: Optional[str] = None,
+                 canonicalizer: Optional[URLCanonicalizer] = None):
+        self.path = Path(path or self.DEFAULT_PATH)
+        self.canonicalizer = canonicalizer or URLCanonicalizer()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS urls (
+                url TEXT PRIMARY KEY,
+                canonical_url TEXT NOT NULL,
+                host TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_status TEXT,
+                last_details TEXT,
+                last_checked REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_urls_host ON urls(host);
+            CREATE INDEX IF NOT EXISTS idx_urls_canonical ON urls(canonical_url);
+            CREATE INDEX IF NOT EXISTS idx_urls_status ON urls(last_status);
+
+            CREATE TABLE IF NOT EXISTS files (
+                file TEXT PRIMARY KEY,
+                week INTEGER,
+                sha256 TEXT NOT NULL,
+                indexed_at REAL NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS citations (
+                url TEXT NOT NULL REFERENCES urls(url),
+                file TEXT NOT NULL REFERENCES files(file) ON DELETE CASCADE,
+                week INTEGER,
+                line INTEGER NOT NULL,
+                PRIMARY KEY (url, file, line)
+            );
+            CREATE INDEX IF NOT EXISTS idx_citations_week ON citations(week);
+            CREATE INDEX IF NOT EXISTS idx_citations_file ON citations(file);
+
+            CREATE TABLE IF NOT EXISTS checks (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT NOT NULL REFERENCES urls(url),
+                status TEXT NOT NULL,
+                details TEXT,
+                checked_at REAL NOT NULL,
+                attempts INTEGER,
+                latency REAL,
+                final_url TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_checks_url ON checks(url, checked_at);
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def week_of(path: Path) -> Optional[int]:
+        """Week number from the nearest weekXX directory in path, if any"""
+        for part in reversed(path.parts):
+            match = WEEK_DIR_RE.match(part)
+            if match:
+                return int(match.group(1))
+        return None
+
+    def index_file(self, file_path: str, week: Optional[int] = None) -> Dict:
+        """
+        Record every URL citation in one markdown file
+
+        Unchanged files (same content hash) are skipped; otherwise the
+        file's previous citations are replaced.
+
+        Args:
+            file_path: Markdown file to index
+            week: Week number (default: derived from the path)
+
+        Returns:
+            Dictionary with file, week, citation count and whether it changed
+        """
+        path = Path(file_path).resolve()
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        week = week if week is not None else self.week_of(path)
+
+        row = self.conn.execute("SELECT sha256 FROM files WHERE file = ?", (str(path),)).fetchone()
+        if row and row["sha256"] == digest:
+            count = self.conn.execute("SELECT COUNT(*) FROM citations WHERE file = ?",
+                                      (str(path),)).fetchone()[0]
+            return {"file": str(path), "week": week, "citations": count, "changed": False}
+
+        links = extract_links(data.decode("utf-8"))
+        now = time.time()
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO files (file, week, sha256, indexed_at) VALUES (?, ?, ?, ?)",
+                (str(path), week, digest, now)
+            )
+            self.conn.execute("DELETE FROM citations WHERE file = ?", (str(path),))
+            self._upsert_urls({url for url, _ in links}, now)
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO citations (url, file, week, line) VALUES (?, ?, ?, ?)",
+                [(url, str(path), week, line) for url, line in links]
+            )
+
+        return {"file": str(path), "week": week, "citations": len(links), "changed": True}
+
+    def index_course(self, base_path: str = ".") -> Dict:
+        """
+        Index every markdown file under every weekXX directory
+
+        Files that disappeared since the last run lose their citations.
+
+        Returns:
+            Dictionary with file, changed-file and citation counts
+        """
+        base = Path(base_path).resolve()
+        seen = set()
+        summary = {"files": 0, "changed": 0, "citations": 0, "removed": 0}
+
+        for week_dir in sorted(base.iterdir()):
+            match = WEEK_DIR_RE.match(week_dir.name)
+            if not match or not week_dir.is_dir():
+                continue
+            for md_file in sorted(week_dir.rglob("*.md")):
+                result = self.index_file(str(md_file), int(match.group(1)))
+                seen.add(result["file"])
+                summary["files"] += 1
+                summary["changed"] += int(result["changed"])
+                summary["citations"] += result["citations"]
+
+        stale = [row["file"] for row in self.conn.execute("SELECT file FROM files")
+                 if row["file"] not in seen and row["file"].startswith(str(base))]
+        with self.conn:
+            self.conn.executemany("DELETE FROM files WHERE file = ?", [(f,) for f in stale])
+        summary["removed"] = len(stale)
+        return summary
+
+    def _upsert_urls(self, urls: Iterable[str], now: float):
+        rows = []
+        for url in urls:
+            canonical = self.canonicalizer.canonicalize(url)
+            try:
+                host = (urlparse(canonical).hostname or "").lower()
+            except ValueError:
+                host = ""
+            rows.append((url, canonical, host, now))
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO urls (url, canonical_url, host, first_seen) VALUES (?, ?, ?, ?)",
+            rows
+        )
+
+    def record_results(self, results: Iterable[URLCheckResult]) -> int:
+        """
+        Update each URL's latest verdict and append real checks to its history
+
+        Cache hits refresh the latest verdict without adding history;
+        results that never reached the host (open circuit, budget) are
+        ignored.
+
+        Returns:
+            Number of checks added to history
+        """
+        now = time.time()
+        verdicts = [r for r in results
+                    if r.status != "unverified" and (r.from_cache or r.attempts > 0)]
+        checks = [r for r in verdicts if not r.from_cache]
+
+        with self.conn:
+            self._upsert_urls({r.url for r in verdicts}, now)
+            self.conn.executemany(
+                "INSERT INTO checks (url, status, details, checked_at, attempts, latency, final_url) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(r.url, r.status, r.details, now, r.attempts, r.latency, r.final_url) for r in checks]
+            )
+            self.conn.executemany(
+                "UPDATE urls SET last_status = ?, last_details = ?, last_checked = ? WHERE url = ?",
+                [(r.status, r.details, now, r.url) for r in checks]
+            )
+            self.conn.executemany(
+                "UPDATE urls SET last_status = ?, last_details = ?, "
+                "last_checked = COALESCE(last_checked, ?) WHERE url = ?",
+                [(r.status, r.details, now, r.url) for r in verdicts if r.from_cache]
+            )
+        return len(checks)
+
+    def record_report(self, report: Dict) -> int:
+        """
+        Record verdicts from a validate_directory or validate_markdown_file result
+
+        Returns:
+            Number of checks recorded
+        """
+        file_results = report.get("files", [report] if "urls" in report else [])
+        results = {}
+        for file_result in file_results:
+            for info in file_result.get("urls", []):
+                results[info["url"]] = URLCheckResult(
+                    info["url"], info["status"], info.get("details"),
+                    from_cache=info.get("cached", False),
+                    attempts=info.get("attempts", 1),
+                    final_url=info.get("final_url"),
+                    latency=info.get("latency", 0.0)
+                )
+        return self.record_results(results.values())
+
+    def validate(self, validator: URLValidator, week: Optional[int] = None) -> Dict:
+        """
+        Check every indexed URL (optionally one week's) and record the verdicts
+
+        Returns:
+            Status counts for the URLs checked
+        """
+        if week is None:
+            rows = self.conn.execute("SELECT DISTINCT url, file FROM citations").fetchall()
+        else:
+            rows = self.conn.execute("SELECT DISTINCT url, file FROM citations WHERE week = ?",
+                                     (week,)).fetchall()
+
+        sources: Dict[str, List[str]] = {}
+        for row in rows:
+            sources.setdefault(row["url"], []).append(row["file"])
+
+        results = asyncio.run(validator.check_urls(list(sources), sources)) if sources else []
+        self.record_results(results)
+
+        counts: Dict[str, int] = {}
+        for result in results:
+            counts[result.status] = counts.get(result.status, 0) + 1
+        return counts
+
+    def cited_spellings(self) -> Dict[str, List[str]]:
+        """
+        Canonical URL -> every cited spelling of it
+
+        Only URLs that are still cited somewhere are included.
+        """
+        spellings: Dict[str, List[str]] = {}
+        for row in self.conn.execute("""
+            SELECT DISTINCT u.canonical_url, u.url
+            FROM urls u JOIN citations c ON c.url = u.url
+            ORDER BY u.canonical_url, u.url
+        """):
+            spellings.setdefault(row["canonical_url"], []).append(row["url"])
+        return spellings
+
+    def flakiness(self, window: int = 10) -> Dict[str, float]:
+        """
+        How often each canonical URL's verdict flips between checks
+
+        Returns:
+            Canonical URL -> share of the last window checks whose status
+            differs from the check before (0.0 steady, 1.0 flips every time)
+        """
+        statuses: Dict[str, List[str]] = {}
+        for row in self.conn.execute("""
+            SELECT u.canonical_url, ch.status
+            FROM checks ch JOIN urls u ON u.url = ch.url
+            ORDER BY u.canonical_url, ch.checked_at, ch.id
+        """):
+            statuses.setdefault(row["canonical_url"], []).append(row["status"])
+
+        scores = {}
+        for canonical, history in statuses.items():
+            recent = history[-(window + 1):]
+            if len(recent) < 2:
+                scores[canonical] = 0.0
+                continue
+            flips = sum(1 for before, after in zip(recent, recent[1:]) if before != after)
+            scores[canonical] = flips / (len(recent) - 1)
+        return scores
+
+    def broken_links(self, week: Optional[int] = None) -> List[Dict]:
+        """
+        All URLs whose latest verdict is broken, with every place they are cited
+
+        Args:
+            week: Restrict to citations in this week
+
+        Returns:
+            List of dictionaries with url, status, details, last_checked and citations
+        """
+        placeholders = ",".join("?" for _ in self.BROKEN_STATUSES)
+        query = f"""
+            SELECT u.url, u.last_status, u.last_details, u.last_checked, c.week, c.file, c.line
+            FROM urls u JOIN citations c ON c.url = u.url
+            WHERE u.last_status IN ({placeholders})
+        """
+        params: List = list(self.BROKEN_STATUSES)
+        if week is not None:
+            query += " AND c.week = ?"
+            params.append(week)
+        query += " ORDER BY u.url, c.week, c.file, c.line"
+
+        broken: Dict[str, Dict] = {}
+        for row in self.conn.execute(query, params):
+            entry = broken.setdefault(row["url"], {
+                "url": row["url"],
+                "status": row["last_status"],
+                "details": row["last_details"],
+                "last_checked": row["last_checked"],
+                "citations": []
+            })
+            entry["citations"].append({"week": row["week"], "file": row["file"], "line": row["line"]})
+        return list(broken.values())
+
+    def weeks_citing_host(self, host: str) -> Dict[int, List[str]]:
+        """
+        Weeks citing a host or any of its subdomains
+
+        Returns:
+            Week number -> URLs on that host cited in the week
+        """
+        host = host.lower()
+        rows = self.conn.execute("""
+            SELECT DISTINCT c.week, u.url
+            FROM urls u JOIN citations c ON c.url = u.url
+            WHERE u.host = ? OR u.host LIKE ?
+            ORDER BY c.week, u.url
+        """, (host, f"%.{host}"))
+
+        weeks: Dict[int, List[str]] = {}
+        for row in rows:
+            weeks.setdefault(row["week"], []).append(row["url"])
+        return weeks
+
+    def history(self, url: str, limit: int = 20) -> List[Dict]:
+        """Most recent checks of a URL, newest first"""
+        rows = self.conn.execute("""
+            SELECT status, details, checked_at, attempts, latency, final_url
+            FROM checks WHERE url = ? ORDER BY checked_at DESC, id DESC LIMIT ?
+        """, (url, limit))
+        return [dict(row) for row in rows]
+
+    def get_stats(self) -> Dict:
+        """Counts of files, URLs, citations, checks and latest verdicts"""
+        count = lambda sql: self.conn.execute(sql).fetchone()[0]
+        statuses = {
+            (row[0] or "unchecked"): row[1]
+            for row in self.conn.execute("SELECT last_status, COUNT(*) FROM urls GROUP BY last_status")
+        }
+        return {
+            "files": count("SELECT COUNT(*) FROM files"),
+            "weeks": count("SELECT COUNT(DISTINCT week) FROM citations"),
+            "urls": count("SELECT COUNT(*) FROM urls"),
+            "canonical_urls": count("SELECT COUNT(DISTINCT canonical_url) FROM urls"),
+            "hosts": count("SELECT COUNT(DISTINCT host) FROM urls"),
+            "citations": count("SELECT COUNT(*) FROM citations"),
+            "checks": count("SELECT COUNT(*) FROM checks"),
+            "by_status": statuses
+        }
+
+    def close(self):
+        self.conn.close()
+
+
+def main():
+    """CLI entry point"""
+    parser = argparse.ArgumentParser(
+        description="ScholarStream Reference Database"
+    )
+    parser.add_argument("--db", default=ReferenceDatabase.DEFAULT_PATH,
+                        help="Reference database location")
+    parser.add_argument("--format", choices=["text", "json"], default="text",
+                        help="Output format")
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    index_parser = subparsers.add_parser("index", help="Index citations in every weekXX directory")
+    index_parser.add_argument("--base", default=".", help="Course root directory")
+
+    validate_parser = subparsers.add_parser("validate", help="Check indexed URLs and record verdicts")
+    validate_parser.add_argument("--week", type=int, help="Only URLs cited in this week")
+    validate_parser.add_argument("--budget", type=float, help="Overall seconds for checking")
+    validate_parser.add_argument("--no-cache", action="store_true",
+                                 help="Ignore the validation cache")
+
+    broken_parser = subparsers.add_parser("broken", help="List broken links across the course")
+    broken_parser.add_argument("--week", type=int, help="Only citations in this week")
+
+    host_parser = subparsers.add_parser("host", help="Weeks citing a host")
+    host_parser.add_argument("host", help="Hostname, e.g. arxiv.org")
+
+    history_parser = subparsers.add_parser("history", help="Validation history of a URL")
+    history_parser.add_argument("url", help="URL as cited")
+
+    subparsers.add_parser("stats", help="Show database statistics")
+
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    db = ReferenceDatabase(args.db)
+
+    if args.command == "index":
+        output = db.index_course(args.base)
+        text = (f"Indexed {output['files']} files ({output['changed']} changed), "
+                f"{output['citations']} citations; removed {output['removed']} missing files")
+
+    elif args.command == "validate":
+        cache = None if args.no_cache else URLValidationCache()
+        output = db.validate(URLValidator(cache=cache, budget=args.budget), args.week)
+        text = "Checked: " + ", ".join(f"{status} {n}" for status, n in sorted(output.items()))
+
+    elif args.command == "broken":
+        output = db.broken_links(args.week)
+        lines = [f"Broken links: {len(output)}"]
+        for entry in output:
+            lines.append(f"\n✗ {entry['url']}")
+            if entry["details"]:
+                lines.append(f"    {entry['details']}")
+            for citation in entry["citations"]:
+                week = f"week{citation['week']:02d}" if citation["week"] is not None else "-"
+                lines.append(f"    {week} {citation['file']}:{citation['line']}")
+        text = "\n".join(lines)
+
+    elif args.command == "host":
+        output = db.weeks_citing_host(args.host)
+        lines = [f"Weeks citing {args.host}: {len(output)}"]
+        for week, urls in output.items():
+            lines.append(f"\nWeek {week}:")
+            lines.extend(f"  {url}" for url in urls)
+        text = "\n".join(lines)
+
+    elif args.command == "history":
+        output = db.history(args.url)
+        lines = [f"History for {args.url}:"]
+        for check in output:
+            checked = time.strftime("%Y-%m-%d %H:%M", time.localtime(check["checked_at"]))
+            lines.append(f"  {checked} {check['status']}"
+                         + (f" - {check['details']}" if check["details"] else ""))
+        text = "\n".join(lines)
+
+    elif args.command == "stats":
+        output = db.get_stats()
+        text = "\n".join(f"{key}: {value}" for key, value in output.items())
+
+    print(json.dumps(output, indent=2) if args.format == "json" else text)
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
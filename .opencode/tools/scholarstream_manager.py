@@ -11,18 +11,25 @@ tools_path = Path(__file__).parent
 sys.path.insert(0, str(tools_path))
 
 from directory_manager import ScholarStreamDirectoryManager
-from url_validator import URLValidator
-from blackboard import ScholarStreamBlackboard
+from url_validator import URLValidator, URLValidationCache
+from blackboard import ScholarStreamBlackboard, BlackboardReplica
+from reference_db import ReferenceDatabase
 
 
 class ScholarStreamManager:
     """Unified interface for all ScholarStream management operations"""
 
+    # Agent invocation notices are only relevant while the agent runs
+    TRANSIENT_ENTRY_TTL = 24 * 60 * 60
+
     def __init__(self, base_path: str = "."):
         self.base_path = Path(base_path).resolve()
         self.dir_manager = ScholarStreamDirectoryManager(base_path)
-        self.url_validator = URLValidator()
+        self.url_validator = URLValidator(
+            cache=URLValidationCache(str(self.base_path / ".opencode" / "url_cache.sqlite3"))
+        )
         self.blackboard = ScholarStreamBlackboard()
+        self.reference_db = ReferenceDatabase(str(self.base_path / ".opencode" / "references.sqlite3"))
 
     def create_week(self, week_num: int, topic: str,
                    hours: int = 3, audience: str = "beginner",
@@ -118,6 +125,9 @@ class ScholarStreamManager:
             plan_dir = week_dir / "plan"
             if plan_dir.exists():
                 url_validation = self.url_validator.validate_directory(str(plan_dir))
+                for md_file in sorted(plan_dir.glob("*.md")):
+                    self.reference_db.index_file(str(md_file), week_num)
+                self.reference_db.record_report(url_validation)
 
         overall_valid = dir_validation["valid"] and (
             not validate_urls or
@@ -191,7 +201,8 @@ class ScholarStreamManager:
             content=f"Invoking planner agent for week {week_num}",
             confidence=1.0,
             tags=["week", f"week{week_num}", "agent_invocation", "planner"],
-            entry_type="task"
+            entry_type="task",
+            ttl=self.TRANSIENT_ENTRY_TTL
         )
 
         print(f"✓ Invoking @planner for week {week_num}")
@@ -216,7 +227,8 @@ class ScholarStreamManager:
             content=f"Invoking slide-generator for week {week_num}",
             confidence=1.0,
             tags=["week", f"week{week_num}", "agent_invocation", "slide-generator"],
-            entry_type="task"
+            entry_type="task",
+            ttl=self.TRANSIENT_ENTRY_TTL
         )
 
         print(f"✓ Invoking @slide-generator for week {week_num}")
@@ -276,6 +288,24 @@ class ScholarStreamManager:
 
         return "\n".join(lines)
 
+    def use_replica(self, replica_path: Optional[str] = None) -> Dict:
+        """
+        Serve blackboard reads from a read replica instead of the live file
+
+        Args:
+            replica_path: Replica storage path (default: next to the live blackboard)
+
+        Returns:
+            Replication lag metrics after catching up
+        """
+        replica = BlackboardReplica(
+            leader_path=str(self.blackboard.storage_path),
+            replica_path=replica_path
+        )
+        replica.sync()
+        self.blackboard = replica.follower
+        return replica.lag()
+
     def export_state(self, output_path: str):
         """
         Export ScholarStream state to JSON
@@ -325,6 +355,8 @@ def main():
     report_parser = subparsers.add_parser("report", help="Generate report")
     report_parser.add_argument("--week", type=int, help="Specific week (default: all)")
     report_parser.add_argument("--output", help="Export report to file")
+    report_parser.add_argument("--replica", nargs="?", const="", default=None,
+                           help="Read blackboard stats from a replica (optional replica path)")
 
     planner_parser = subparsers.add_parser("planner", help="Invoke planner agent")
     planner_parser.add_argument("week", type=int, help="Week number")
@@ -381,6 +413,8 @@ def main():
             print(f"Week {args.week} does not exist")
 
     elif args.command == "report":
+        if args.replica is not None:
+            manager.use_replica(args.replica or None)
         report = manager.generate_report(args.week)
         if args.output:
             Path(args.output).write_text(report, encoding="utf-8")
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""URL Bench for ScholarStream - Offline test server and throughput benchmark for URLValidator"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+from aiohttp import web
+
+from url_validator import URLValidator, URLCheckResult, performance_summary
+
+
+def parse_latency(spec: str) -> Callable[[], float]:
+    """
+    Parse a latency distribution into a sampler returning seconds
+
+    Supported forms:
+        fixed:S             always S seconds
+        uniform:A,B         uniform between A and B
+        exp:MEAN            exponential with the given mean
+        lognormal:MU,SIGMA  log-normal (median e**MU), for long tails
+    """
+    kind, _, params = spec.partition(":")
+    values = [float(v) for v in params.split(",") if v]
+
+    if kind == "fixed":
+        return lambda: values[0] if values else 0.0
+    if kind == "uniform":
+        return lambda: random.uniform(values[0], values[1])
+    if kind == "exp":
+        return lambda: random.expovariate(1.0 / values[0])
+    if kind == "lognormal":
+        return lambda: random.lognormvariate(values[0], values[1])
+    raise ValueError(f"Unknown latency distribution: {spec}")
+
+
+class BenchServer:
+    """
+    Local aiohttp server with routes that imitate real reference hosts
+
+    Routes:
+        /status/{code}     respond with that status code
+        /redirect/{n}      redirect chain of n hops ending at /status/200
+        /nohead            405 on HEAD, 200 on GET (like many CDNs)
+        /ratelimit/{key}   429 with Retry-After once a key exceeds rate_limit req/s
+
+    Every route sleeps for a sample of the latency distribution first; a
+    ?delay=<spec> query parameter overrides it per request. The server runs
+    on its own thread and event loop, so synchronous validator entry points
+    (which call asyncio.run) can be benchmarked against it.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 latency: str = "fixed:0", rate_limit: float = 200.0):
+        self.host = host
+        self.port = port
+        self.latency = parse_latency(latency)
+        self.rate_limit = rate_limit
+        self.requests = 0
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def build_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_route("*", "/status/{code}", self._status)
+        app.router.add_route("*", "/redirect/{hops}", self._redirect)
+        app.router.add_route("*", "/nohead", self._nohead)
+        app.router.add_route("*", "/ratelimit/{key}", self._ratelimit)
+        return app
+
+    async def _delay(self, request: web.Request):
+        self.requests += 1
+        spec = request.query.get("delay")
+        await asyncio.sleep(parse_latency(spec)() if spec else self.latency())
+
+    async def _status(self, request: web.Request) -> web.Response:
+        await self._delay(request)
+        return web.Response(status=int(request.match_info["code"]))
+
+    async def _redirect(self, request: web.Request) -> web.Response:
+        await self._delay(request)
+        hops = int(request.match_info["hops"])
+        target = f"/redirect/{hops - 1}" if hops > 1 else "/status/200"
+        raise web.HTTPFound(target)
+
+    async def _nohead(self, request: web.Request) -> web.Response:
+        await self._delay(request)
+        if request.method == "HEAD":
+            return web.Response(status=405)
+        return web.Response(status=200, text="ok")
+
+    async def _ratelimit(self, request: web.Request) -> web.Response:
+        await self._delay(request)
+        # Token bucket per key, refilled at rate_limit tokens per second
+        key = request.match_info["key"]
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (self.rate_limit, now))
+        tokens = min(self.rate_limit, tokens + (now - updated) * self.rate_limit)
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            retry_after = math.ceil((1 - tokens) / self.rate_limit)
+            return web.Response(status=429, headers={"Retry-After": str(retry_after)})
+        self._buckets[key] = (tokens - 1, now)
+        return web.Response(status=200)
+
+    def start(self) -> "BenchServer":
+        started = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._runner = web.AppRunner(self.build_app(), access_log=None)
+            self._loop.run_until_complete(self._runner.setup())
+            site = web.TCPSite(self._runner, self.host, self.port)
+            self._loop.run_until_complete(site.start())
+            self.port = self._runner.addresses[0][1]
+            started.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self._runner.cleanup())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="url-bench-server", daemon=True)
+        self._thread.start()
+        started.wait()
+        return self
+
+    def stop(self):
+        if self._loop and self._thread:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "BenchServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+# Route mix used by the benchmark: (share, path, statuses counted as correct)
+DEFAULT_MIX = [
+    (0.70, "/status/200", {"valid"}),
+    (0.10, "/status/404", {"invalid"}),
+    (0.05, "/status/503", {"warning"}),
+    (0.05, "/redirect/2", {"redirect"}),
+    (0.05, "/nohead", {"valid"}),
+    (0.05, "/ratelimit/shared", {"valid", "warning"})
+]
+
+# Cited URLs with a malformed authority, appended to every workload: they
+# must come back invalid rather than abort the run
+MALFORMED_AUTHORITIES = [":PORT/api", ":99999/"]
+
+
+def build_workload(base_url: str, count: int, follow_redirects: bool = False,
+                   seed: int = 0) -> List[Tuple[str, Set[str]]]:
+    """
+    Generate count distinct URLs following DEFAULT_MIX, plus one URL per
+    MALFORMED_AUTHORITIES entry on the server's host
+
+    Returns:
+        List of (url, acceptable statuses)
+    """
+    rng = random.Random(seed)
+    paths = [entry[1] for entry in DEFAULT_MIX]
+    weights = [entry[0] for entry in DEFAULT_MIX]
+    expected = {entry[1]: entry[2] for entry in DEFAULT_MIX}
+    if follow_redirects:
+        expected["/redirect/2"] = {"valid"}
+
+    workload = []
+    for i, path in enumerate(rng.choices(paths, weights, k=count)):
+        workload.append((f"{base_url}{path}?i={i}", expected[path]))
+
+    host = urlparse(base_url).hostname
+    for authority in MALFORMED_AUTHORITIES:
+        workload.append((f"http://{host}{authority}", {"invalid"}))
+    return workload
+
+
+class _RecordingValidator(URLValidator):
+    """Keeps the full results that validate_urls_batch reduces to tuples"""
+
+    async def check_urls(self, urls, sources=None) -> List[URLCheckResult]:
+        results = await super().check_urls(urls, sources)
+        self.recorded = results
+        return results
+
+
+def _score(results: List[URLCheckResult], workload: List[Tuple[str, Set[str]]],
+           elapsed: float) -> Dict:
+    expected = dict(workload)
+    correct = sum(1 for r in results if r.status in expected.get(r.url, ()))
+    latency = performance_summary(results)["latency"]
+    return {
+        "urls": len(workload),
+        "seconds": round(elapsed, 3),
+        "urls_per_sec": round(len(workload) / elapsed, 1) if elapsed else 0.0,
+        "p50": latency["p50"],
+        "p95": latency["p95"],
+        "p99": latency["p99"],
+        "max": latency["max"],
+        "correct": round(100.0 * correct / len(workload), 2) if workload else 100.0
+    }
+
+
+def bench_batch(validator: _RecordingValidator, workload: List[Tuple[str, Set[str]]]) -> Dict:
+    """Time validate_urls_batch over the workload"""
+    urls = [url for url, _ in workload]
+    started = time.perf_counter()
+    asyncio.run(validator.validate_urls_batch(urls))
+    return _score(validator.recorded, workload, time.perf_counter() - started)
+
+
+def bench_directory(validator: _RecordingValidator, workload: List[Tuple[str, Set[str]]],
+                    urls_per_file: int = 50) -> Dict:
+    """Time validate_directory over markdown files citing the workload"""
+    with tempfile.TemporaryDirectory(prefix="url_bench_") as tmp:
+        for start in range(0, len(workload), urls_per_file):
+            chunk = workload[start:start + urls_per_file]
+            lines = [f"- [ref {start + i}]({url})" for i, (url, _) in enumerate(chunk)]
+            Path(tmp, f"refs_{start // urls_per_file:05d}.md").write_text(
+                "\n".join(lines) + "\n", encoding="utf-8"
+            )
+
+        started = time.perf_counter()
+        validator.validate_directory(tmp)
+        return _score(validator.recorded, workload, time.perf_counter() - started)
+
+
+def run_benchmark(sizes: List[int], scenarios: List[str], latency: str = "fixed:0",
+                  rate_limit: float = 200.0, **validator_args) -> List[Dict]:
+    """
+    Run every scenario at every size against a fresh local server
+
+    Args:
+        sizes: URL counts to test
+        scenarios: 'batch' and/or 'directory'
+        latency: Server latency distribution (see parse_latency)
+        rate_limit: Requests per second allowed on /ratelimit routes
+        validator_args: Passed to URLValidator (cache is always disabled)
+
+    Returns:
+        List of result rows
+    """
+    rows = []
+    with BenchServer(latency=latency, rate_limit=rate_limit) as server:
+        for size in sizes:
+            workload = build_workload(server.base_url, size,
+                                      validator_args.get("follow_redirects", False))
+            for scenario in scenarios:
+                validator = _RecordingValidator(cache=None, **validator_args)
+                requests_before = server.requests
+                if scenario == "batch":
+                    row = bench_batch(validator, workload)
+                else:
+                    row = bench_directory(validator, workload)
+                row["scenario"] = scenario
+                row["requests"] = server.requests - requests_before
+                rows.append(row)
+    return rows
+
+
+def format_rows(rows: List[Dict]) -> str:
+    header = (f"{'scenario':<10} {'urls':>7} {'requests':>9} {'seconds':>9} {'urls/s':>9} "
+              f"{'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'correct':>8}")
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        lines.append(
+            f"{row['scenario']:<10} {row['urls']:>7} {row['requests']:>9} {row['seconds']:>9.3f} "
+            f"{row['urls_per_sec']:>9.1f} {row['p50']:>8.4f} {row['p95']:>8.4f} "
+            f"{row['p99']:>8.4f} {row['max']:>8.4f} {row['correct']:>7.2f}%"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    """CLI entry point"""
+    parser = argparse.ArgumentParser(
+        description="ScholarStream URL Validator Benchmark"
+    )
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    serve_parser = subparsers.add_parser("serve", help="Run the local test server until interrupted")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Bind address")
+    serve_parser.add_argument("--port", type=int, default=8765, help="Bind port")
+
+    run_parser = subparsers.add_parser("run", help="Benchmark URLValidator against the local server")
+    run_parser.add_argument("--sizes", default="10,100,10000",
+                            help="Comma-separated URL counts")
+    run_parser.add_argument("--scenarios", default="batch,directory",
+                            help="Comma-separated: batch (validate_urls_batch), directory (validate_directory)")
+    run_parser.add_argument("--max-concurrent", type=int, default=64,
+                            help="Maximum concurrent requests overall")
+    run_parser.add_argument("--per-host", type=int, default=16,
+                            help="Maximum concurrent requests per host")
+    run_parser.add_argument("--retries", type=int, default=2,
+                            help="Retries for timeouts, connection errors, 429 and 5xx")
+    run_parser.add_argument("--backoff", type=float, default=0.05,
+                            help="Base backoff in seconds")
+    run_parser.add_argument("--breaker-threshold", type=int, default=0,
+                            help="Circuit breaker threshold; off by default because every "
+                                 "route shares one host and the mix injects 5xx")
+    run_parser.add_argument("--follow-redirects", action="store_true",
+                            help="Follow redirect chains")
+    run_parser.add_argument("--timeout", type=int, default=10,
+                            help="Per-request timeout in seconds")
+    run_parser.add_argument("--format", choices=["text", "json"], default="text",
+                            help="Output format")
+
+    for sub in (serve_parser, run_parser):
+        sub.add_argument("--latency", default="lognormal:-4.6,0.5",
+                         help="Server latency distribution: fixed:S, uniform:A,B, exp:MEAN, lognormal:MU,SIGMA")
+        sub.add_argument("--rate-limit", type=float, default=200.0,
+                         help="Requests per second allowed per /ratelimit key")
+
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    if args.command == "serve":
+        server = BenchServer(args.host, args.port, args.latency, args.rate_limit).start()
+        print(f"Serving on {server.base_url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            server.stop()
+
+    elif args.command == "run":
+        rows = run_benchmark(
+            sizes=[int(size) for size in args.sizes.split(",")],
+            scenarios=[s.strip() for s in args.scenarios.split(",")],
+            latency=args.latency,
+            rate_limit=args.rate_limit,
+            timeout=args.timeout,
+            max_concurrent=args.max_concurrent,
+            per_host=args.per_host,
+            retries=args.retries,
+            backoff_base=args.backoff,
+            breaker_threshold=args.breaker_threshold,
+            follow_redirects=args.follow_redirects
+        )
+        if args.format == "json":
+            print(json.dumps(rows, indent=2))
+        else:
+            print(format_rows(rows))
+
+
+if __name__ == "__main__":
+    main()
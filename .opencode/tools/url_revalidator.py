@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""URL Revalidator for ScholarStream - Background worker that keeps the validation cache fresh"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple
+
+import aiohttp
+
+from reference_db import ReferenceDatabase
+from url_validator import (CircuitBreaker, URLCheckResult, URLValidationCache, URLValidator,
+                           normalize_url)
+
+
+class URLRevalidator:
+    """
+    Re-checks known URLs at a low, steady rate before their cache entries expire
+
+    Cache entries are keyed by canonical URL; with a reference database the
+    first cited spelling is what gets requested.
+
+    A URL is due once it has used REFRESH_FRACTION of its cache TTL, so
+    foreground validations keep hitting fresh entries. URLs whose verdict
+    has flipped between recent checks get a proportionally shorter TTL.
+    Stale records' ETag/Last-Modified make most re-checks conditional.
+    """
+
+    # Share of a verdict's TTL after which it is refreshed
+    REFRESH_FRACTION = 0.8
+
+    # Flakiness 1.0 shortens the effective TTL by a factor of 1 + FLAKY_WEIGHT
+    FLAKY_WEIGHT = 3.0
+
+    def __init__(self, cache: URLValidationCache,
+                 reference_db: Optional[ReferenceDatabase] = None,
+                 rate: float = 0.5, max_concurrent: int = 2,
+                 validator: Optional[URLValidator] = None):
+        """
+        Args:
+            cache: Validation cache to keep fresh
+            reference_db: Source of cited URLs and check history; without it
+                          every URL already in the cache is maintained
+            rate: Requests started per second
+            max_concurrent: Requests in flight at once
+            validator: Validator whose timeout, retry and breaker settings are used
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be at least 1, got {max_concurrent}")
+        self.cache = cache
+        self.reference_db = reference_db
+        self.rate = rate
+        self.max_concurrent = max_concurrent
+        self.validator = validator or URLValidator(cache=None, retries=1)
+
+    def due_urls(self, limit: Optional[int] = None,
+                 now: Optional[float] = None) -> List[Tuple[str, float, Optional[Dict]]]:
+        """
+        URLs due for revalidation, most overdue first
+
+        Returns:
+            List of (url, staleness, cached record); staleness is age over
+            effective TTL and is infinite for URLs never checked
+        """
+        now = now or time.time()
+        records = {entry["url"]: entry
+                   for entry in self.cache.entries(self.validator.follow_redirects)}
+
+        if self.reference_db:
+            urls = [normalize_url(url) for url in self.reference_db.cited_spellings()]
+            flakiness = {normalize_url(url): score
+                         for url, score in self.reference_db.flakiness().items()}
+        else:
+            urls = list(records)
+            flakiness = {}
+
+        due = []
+        for url in dict.fromkeys(urls):
+            record = records.get(url)
+            if record is None:
+                due.append((url, float("inf"), None))
+                continue
+            ttl = self.cache.ttls.get(record["status"], 0) or 1.0
+            effective_ttl = ttl / (1 + self.FLAKY_WEIGHT * flakiness.get(url, 0.0))
+            staleness = (now - record["checked_at"]) / effective_ttl
+            if staleness >= self.REFRESH_FRACTION:
+                due.append((url, staleness, record))
+
+        due.sort(key=lambda item: -item[1])
+        return due[:limit] if limit is not None else due
+
+    async def run_once(self, limit: Optional[int] = None) -> Dict:
+        """
+        Re-check due URLs, paced at self.rate, and store the verdicts
+
+        Returns:
+            Dictionary with due, checked and changed counts plus counts by status
+        """
+        due = self.due_urls(limit)
+        summary = {"due": len(due), "checked": 0, "changed": 0, "by_status": {}}
+        if not due:
+            return summary
+
+        spellings = ({normalize_url(canonical): originals
+                      for canonical, originals in self.reference_db.cited_spellings().items()}
+                     if self.reference_db else {})
+
+        self.validator.reset_redirects()
+        connector = aiohttp.TCPConnector(limit=self.max_concurrent, resolver=self.validator.resolver)
+        breaker = CircuitBreaker(self.validator.breaker_threshold, self.validator.breaker_cooldown)
+        slots = asyncio.Semaphore(self.max_concurrent)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=self.validator.timeout) as session:
+            async def check(url: str, record: Optional[Dict]) -> URLCheckResult:
+                request_url = spellings.get(url, [url])[0]
+                try:
+                    result = await self.validator.check_url(session, request_url, record, breaker)
+                    # Refresh the verdict in the mode it is cached under
+                    if self.validator.follow_redirects and result.status == "redirect":
+                        result = await self.validator.resolve_redirects(session, request_url, result,
+                                                                        breaker=breaker)
+                    return replace(result, url=url)
+                finally:
+                    slots.release()
+
+            tasks = []
+            for url, _, record in due:
+                await slots.acquire()
+                tasks.append(asyncio.ensure_future(check(url, record)))
+                await asyncio.sleep(1.0 / self.rate)
+            results = await asyncio.gather(*tasks)
+
+        # Results that never reached the host (open circuit) are not verdicts
+        verdicts = [r for r in results if r.attempts > 0]
+        self.cache.put_many(verdicts, self.validator.follow_redirects)
+        if self.reference_db:
+            self.reference_db.record_results(self._to_spellings(verdicts))
+
+        previous = {url: record for url, _, record in due}
+        for result in verdicts:
+            summary["checked"] += 1
+            summary["by_status"][result.status] = summary["by_status"].get(result.status, 0) + 1
+            record = previous.get(result.url)
+            if record and record["status"] != result.status:
+                summary["changed"] += 1
+        return summary
+
+    async def run(self, interval: float = 300.0, iterations: Optional[int] = None,
+                  on_cycle=None):
+        """
+        Revalidate forever (or for a number of cycles), one cycle per interval
+
+        Each cycle checks at most rate * interval URLs, so the request rate
+        stays flat however large the backlog is.
+        """
+        cycle = 0
+        while iterations is None or cycle < iterations:
+            started = time.monotonic()
+            summary = await self.run_once(max(1, int(self.rate * interval)))
+            cycle += 1
+            if on_cycle:
+                on_cycle(cycle, summary)
+            if iterations is not None and cycle >= iterations:
+                break
+            await asyncio.sleep(max(interval - (time.monotonic() - started), 0))
+
+    def _to_spellings(self, results: List[URLCheckResult]) -> List[URLCheckResult]:
+        """Fan canonical results out to every cited spelling for the reference history"""
+        spellings = {normalize_url(canonical): originals
+                     for canonical, originals in self.reference_db.cited_spellings().items()}
+        return [
+            replace(result, url=original, canonical_url=result.url)
+            for result in results
+            for original in spellings.get(result.url, [result.url])
+        ]
+
+
+def main():
+    """CLI entry point"""
+    parser = argparse.ArgumentParser(
+        description="ScholarStream URL Revalidator"
+    )
+    parser.add_argument("--cache-path", default=URLValidationCache.DEFAULT_PATH,
+                        help="Validation cache to keep fresh")
+    parser.add_argument("--db", default=ReferenceDatabase.DEFAULT_PATH,
+                        help="Reference database listing cited URLs")
+    parser.add_argument("--no-db", action="store_true",
+                        help="Maintain every cached URL instead of only cited ones")
+    parser.add_argument("--rate", type=float, default=0.5,
+                        help="Requests started per second")
+    parser.add_argument("--max-concurrent", type=int, default=2,
+                        help="Requests in flight at once")
+    parser.add_argument("--timeout", type=int, default=10,
+                        help="Per-request timeout in seconds")
+    parser.add_argument("--follow-redirects", action="store_true",
+                        help="Maintain verdicts cached by --follow-redirects runs")
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    due_parser = subparsers.add_parser("due", help="List URLs due for revalidation")
+    due_parser.add_argument("--limit", type=int, default=50, help="Maximum URLs to list")
+
+    once_parser = subparsers.add_parser("once", help="Run a single revalidation pass")
+    once_parser.add_argument("--limit", type=int, help="Maximum URLs to check")
+
+    run_parser = subparsers.add_parser("run", help="Revalidate continuously")
+    run_parser.add_argument("--interval", type=float, default=300.0,
+                            help="Seconds per cycle")
+    run_parser.add_argument("--iterations", type=int,
+                            help="Stop after this many cycles (default: run until interrupted)")
+
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    if args.rate <= 0:
+        parser.error("--rate must be positive")
+    if args.max_concurrent < 1:
+        parser.error("--max-concurrent must be at least 1")
+
+    revalidator = URLRevalidator(
+        cache=URLValidationCache(args.cache_path),
+        reference_db=None if args.no_db else ReferenceDatabase(args.db),
+        rate=args.rate,
+        max_concurrent=args.max_concurrent,
+        validator=URLValidator(timeout=args.timeout, cache=None, retries=1,
+                               follow_redirects=args.follow_redirects)
+    )
+
+    if args.command == "due":
+        due = revalidator.due_urls(args.limit)
+        print(f"Due for revalidation: {len(due)}")
+        for url, staleness, record in due:
+            status = record["status"] if record else "never checked"
+            shown = "new" if staleness == float("inf") else f"{staleness:.2f}"
+            print(f"  [{shown}] {url} ({status})")
+
+    elif args.command == "once":
+        summary = asyncio.run(revalidator.run_once(args.limit))
+        print(json.dumps(summary, indent=2))
+
+    elif args.command == "run":
+        def report(cycle: int, summary: Dict):
+            print(f"[{time.strftime('%H:%M:%S')}] cycle {cycle}: "
+                  f"due {summary['due']}, checked {summary['checked']}, changed {summary['changed']}",
+                  flush=True)
+
+        try:
+            asyncio.run(revalidator.run(args.interval, args.iterations, report))
+        except KeyboardInterrupt:
+            print("Stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,19 +3,832 @@
 import asyncio
 import aiohttp
 import argparse
+import hashlib
+import ipaddress
+import json
+import os
+import random
 import re
+import socket
+import sqlite3
 import sys
-from typing import List, Tuple, Dict, Optional
-from urllib.parse import urlparse
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, asdict, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import AsyncIterator, Callable, List, Tuple, Dict, Optional, TextIO
+from urllib.parse import urljoin, urlparse, urlunparse
 from pathlib import Path
+from aiohttp.abc import AbstractResolver, ResolveResult
+from aiohttp.resolver import DefaultResolver
+
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Statuses worth another attempt after a backoff
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# Statuses servers commonly return when they refuse HEAD but serve GET
+HEAD_REJECTED_STATUSES = {400, 403, 405, 501}
+
+# Markdown link syntax, compiled once for every extraction
+_FENCE_RE = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+_REFERENCE_DEF_RE = re.compile(r'^ {0,3}\[[^\]]+\]:\s*<?(https?://[^\s>]+)>?')
+_CODE_SPAN_RE = re.compile(r'(`+).+?\1')
+_INLINE_LINK_RE = re.compile(r'\]\(\s*(<)?(?=https?://)')
+_AUTOLINK_RE = re.compile(r'<(https?://[^\s<>]+)>')
+_BARE_URL_RE = re.compile(r'https?://[^\s<>\[\]{}"\'`|]+')
+_TRAILING_PUNCTUATION = '.,;:!?*_~\'"'
+
+
+def _trim_bare_url(url: str) -> str:
+    """Strip trailing prose punctuation and unbalanced closing parentheses"""
+    while url:
+        if url[-1] in _TRAILING_PUNCTUATION:
+            url = url[:-1]
+        elif url[-1] == ')' and url.count(')') > url.count('('):
+            url = url[:-1]
+        else:
+            break
+    return url
+
+
+def _inline_destination(line: str, start: int, bracketed: bool) -> Tuple[str, int]:
+    """
+    Read an inline link destination starting at start
+
+    Parentheses inside the URL are balanced, so Wikipedia-style
+    destinations such as .../Graph_(discrete_mathematics) survive intact.
+
+    Returns:
+        Tuple of (url, end index)
+    """
+    if bracketed:
+        end = line.find('>', start)
+        end = len(line) if end == -1 else end
+        return line[start:end], end
+
+    depth = 0
+    pos = start
+    while pos < len(line):
+        char = line[pos]
+        if char.isspace():
+            break
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            if depth == 0:
+                break
+            depth -= 1
+        pos += 1
+    return line[start:pos], pos
+
+
+def extract_links(content: str) -> List[Tuple[str, int]]:
+    """
+    Extract http(s) links from markdown in a single pass
+
+    Understands inline links, autolinks, reference definitions and bare
+    URLs; fenced code blocks (including mermaid diagrams) and inline code
+    spans are skipped.
+
+    Args:
+        content: Markdown text
+
+    Returns:
+        List of (url, line number) in document order, duplicates included
+    """
+    links: List[Tuple[str, int]] = []
+    fence: Optional[str] = None
+
+    for line_no, line in enumerate(content.splitlines(), 1):
+        fence_match = _FENCE_RE.match(line)
+        if fence:
+            if fence_match and fence_match.group(1)[0] == fence[0] and len(fence_match.group(1)) >= len(fence):
+                fence = None
+            continue
+        if fence_match:
+            fence = fence_match.group(1)
+            continue
+
+        ref_match = _REFERENCE_DEF_RE.match(line)
+        if ref_match:
+            links.append((ref_match.group(1), line_no))
+            continue
+
+        if '://' not in line:
+            continue
+
+        # Blank out code spans and consumed links so later passes skip them
+        line = _CODE_SPAN_RE.sub(lambda m: ' ' * len(m.group(0)), line)
+        found: List[Tuple[int, str]] = []
+
+        for match in list(_INLINE_LINK_RE.finditer(line)):
+            url, end = _inline_destination(line, match.end(), bool(match.group(1)))
+            if url:
+                found.append((match.end(), url))
+                line = line[:match.end()] + ' ' * (end - match.end()) + line[end:]
+
+        for match in _AUTOLINK_RE.finditer(line):
+            found.append((match.start(), match.group(1)))
+        line = _AUTOLINK_RE.sub(lambda m: ' ' * len(m.group(0)), line)
+
+        for match in _BARE_URL_RE.finditer(line):
+            url = _trim_bare_url(match.group(0))
+            if url:
+                found.append((match.start(), url))
+
+        links.extend((url, line_no) for _, url in sorted(found))
+
+    return links
+
+
+def _scan_markdown_file(path: str) -> Tuple[str, List[str]]:
+    """Process-pool worker: content hash and unique URLs of one file in document order"""
+    data = Path(path).read_bytes()
+    urls = list(dict.fromkeys(url for url, _ in extract_links(data.decode("utf-8"))))
+    return hashlib.sha256(data).hexdigest(), urls
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for cache lookups
+
+    Lowercases scheme and host, drops default ports and the fragment.
+    A URL with a malformed authority (placeholder or out-of-range port,
+    broken IPv6 literal) is returned stripped but otherwise unchanged; the
+    request for it then reports it invalid.
+    """
+    try:
+        parsed = urlparse(url.strip())
+        port = parsed.port
+    except ValueError:
+        return url.strip()
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or "").lower()
+
+    netloc = host
+    if port and port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{port}"
+    if parsed.username:
+        netloc = f"{parsed.username}@{netloc}"
+
+    return urlunparse((scheme, netloc, parsed.path or "/", parsed.params, parsed.query, ""))
+
+
+# Query parameters that only track where a click came from
+_TRACKING_PARAM_RE = re.compile(r'^(utm_[a-z_]+|fbclid|gclid|mc_cid|mc_eid)$', re.IGNORECASE)
+
+_ARXIV_PATH_RE = re.compile(r'^/(?:abs|pdf)/(.+?)(?:\.pdf)?/?$')
+_DOI_PATH_RE = re.compile(r'^/(10\.\d{4,9}/.+)$')
+
+
+def _arxiv_rule(parsed) -> Optional[str]:
+    """abs/ and pdf/ forms (with or without .pdf) resolve to one abstract page"""
+    match = _ARXIV_PATH_RE.match(parsed.path)
+    return f"https://arxiv.org/abs/{match.group(1)}" if match else None
+
+
+def _doi_rule(parsed) -> Optional[str]:
+    """doi.org, dx.doi.org and http variants are the same resolver; DOIs ignore case"""
+    match = _DOI_PATH_RE.match(parsed.path)
+    return f"https://doi.org/{match.group(1).lower()}" if match else None
+
+
+class URLCanonicalizer:
+    """
+    Collapses spelling variants of the same resource to one canonical URL
+
+    Generic rules upgrade http to https, drop fragments, tracking
+    parameters and trailing slashes. Site rules registered for a host
+    take precedence and may rewrite the URL entirely.
+
+    The canonical form is only an identity for deduplication and cache
+    keys; it is never requested, since a server may only speak http or
+    redirect the slash-less path.
+    """
+
+    DEFAULT_SITE_RULES = {
+        "arxiv.org": _arxiv_rule,
+        "www.arxiv.org": _arxiv_rule,
+        "export.arxiv.org": _arxiv_rule,
+        "doi.org": _doi_rule,
+        "dx.doi.org": _doi_rule,
+        "www.doi.org": _doi_rule
+    }
+
+    def __init__(self, upgrade_https: bool = True):
+        self.upgrade_https = upgrade_https
+        self.site_rules: Dict[str, Callable] = dict(self.DEFAULT_SITE_RULES)
+
+    def register_rule(self, host: str, rule: Callable):
+        """
+        Register a site-specific rule
+
+        Args:
+            host: Lowercase hostname the rule applies to
+            rule: Callable taking the parsed URL and returning the canonical
+                  URL, or None to fall through to the generic rules
+        """
+        self.site_rules[host.lower()] = rule
+
+    def canonicalize(self, url: str) -> str:
+        """Return the canonical spelling used for deduplication and cache keys"""
+        normalized = normalize_url(url)
+        try:
+            parsed = urlparse(normalized)
+            port = parsed.port
+        except ValueError:
+            # Malformed authority: only exact duplicates collapse
+            return normalized
+
+        rule = self.site_rules.get(parsed.hostname or "")
+        if rule:
+            rewritten = rule(parsed)
+            if rewritten:
+                return rewritten
+
+        scheme = parsed.scheme
+        netloc = parsed.netloc
+        if self.upgrade_https and scheme == "http" and port is None:
+            scheme = "https"
+
+        query = "&".join(
+            pair for pair in parsed.query.split("&")
+            if pair and not _TRACKING_PARAM_RE.match(pair.split("=", 1)[0])
+        )
+        path = parsed.path
+        if len(path) > 1 and path.endswith("/"):
+            path = path.rstrip("/") or "/"
+
+        return urlunparse((scheme, netloc, path, parsed.params, query, ""))
+
+    def group(self, urls: List[str]) -> Dict[str, List[str]]:
+        """
+        Group URLs by canonical form
+
+        Returns:
+            Canonical URL -> original spellings, both in first-seen order
+        """
+        groups: Dict[str, List[str]] = {}
+        for url in dict.fromkeys(urls):
+            groups.setdefault(self.canonicalize(url), []).append(url)
+        return groups
+
+
+@dataclass
+class URLCheckResult:
+    """Outcome of checking a single URL"""
+    url: str
+    status: str
+    details: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    from_cache: bool = False
+    attempts: int = 1
+    final_url: Optional[str] = None
+    canonical_url: Optional[str] = None
+    # Seconds spent on the network, including retries and redirect hops
+    latency: float = 0.0
+
+    def as_tuple(self) -> Tuple[str, str, Optional[str]]:
+        return (self.url, self.status, self.details)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class URLValidationCache:
+    """
+    Persistent SQLite cache of URL verdicts keyed by normalized URL
+
+    Verdicts are also keyed by redirect mode: with follow_redirects a
+    redirecting URL carries its final target's verdict, which must not be
+    served to a run that reports redirects as such (or vice versa).
+    """
+
+    DEFAULT_PATH = ".opencode/url_cache.sqlite3"
+
+    # Seconds a verdict stays fresh, per status
+    DEFAULT_TTLS = {
+        "valid": 7 * 24 * 3600,
+        "redirect": 3 * 24 * 3600,
+        "invalid": 6 * 3600,
+        "warning": 3600
+    }
+
+    def __init__(self, path: Optional[str] = None, ttls: Optional[Dict[str, float]] = None):
+        self.path = Path(path or self.DEFAULT_PATH)
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(url_cache)")]
+        legacy = bool(columns) and "follow_redirects" not in columns
+        if legacy:
+            self.conn.execute("ALTER TABLE url_cache RENAME TO url_cache_legacy")
+
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS url_cache (
+                url TEXT NOT NULL,
+                follow_redirects INTEGER NOT NULL DEFAULT 0,
+                status TEXT NOT NULL,
+                details TEXT,
+                checked_at REAL NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                PRIMARY KEY (url, follow_redirects)
+            )
+        """)
+        if legacy:
+            # Older caches did not record the mode; only a followed redirect says which it was
+            self.conn.execute("""
+                INSERT INTO url_cache
+                SELECT url, CASE WHEN details LIKE 'Resolved via %' THEN 1 ELSE 0 END,
+                       status, details, checked_at, etag, last_modified
+                FROM url_cache_legacy
+            """)
+            self.conn.execute("DROP TABLE url_cache_legacy")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS file_manifest (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                sha256 TEXT NOT NULL,
+                urls TEXT NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def get(self, url: str, follow_redirects: bool = False) -> Optional[Dict]:
+        """
+        Look up the cached verdict for a URL
+
+        Args:
+            url: URL to look up
+            follow_redirects: Redirect mode the verdict must have been made in
+
+        Returns:
+            Record dictionary (with a 'fresh' flag) or None
+        """
+        row = self.conn.execute(
+            "SELECT status, details, checked_at, etag, last_modified FROM url_cache "
+            "WHERE url = ? AND follow_redirects = ?",
+            (normalize_url(url), int(follow_redirects))
+        ).fetchone()
+
+        if not row:
+            return None
+
+        status, details, checked_at, etag, last_modified = row
+        return {
+            "status": status,
+            "details": details,
+            "checked_at": checked_at,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fresh": time.time() - checked_at < self.ttls.get(status, 0)
+        }
+
+    def put_many(self, results: List[URLCheckResult], follow_redirects: bool = False):
+        """Store fresh verdicts for a batch of results made in the given redirect mode"""
+        now = time.time()
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO url_cache "
+            "(url, follow_redirects, status, details, checked_at, etag, last_modified) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (normalize_url(r.url), int(follow_redirects), r.status, r.details, now,
+                 r.etag, r.last_modified)
+                for r in results
+            ]
+        )
+        self.conn.commit()
+
+    def entries(self, follow_redirects: bool = False) -> List[Dict]:
+        """All cached records for a redirect mode, with the same fields and 'fresh' flag as get()"""
+        now = time.time()
+        return [
+            {
+                "url": url,
+                "status": status,
+                "details": details,
+                "checked_at": checked_at,
+                "etag": etag,
+                "last_modified": last_modified,
+                "fresh": now - checked_at < self.ttls.get(status, 0)
+            }
+            for url, status, details, checked_at, etag, last_modified in self.conn.execute(
+                "SELECT url, status, details, checked_at, etag, last_modified FROM url_cache "
+                "WHERE follow_redirects = ?", (int(follow_redirects),)
+            )
+        ]
+
+    def get_manifest(self, paths: List[str]) -> Dict[str, Dict]:
+        """
+        Look up manifest records for files
+
+        Returns:
+            Mapping of path to {'size', 'mtime_ns', 'sha256', 'urls'}
+        """
+        records = {}
+        for path in paths:
+            row = self.conn.execute(
+                "SELECT size, mtime_ns, sha256, urls FROM file_manifest WHERE path = ?", (path,)
+            ).fetchone()
+            if row:
+                records[path] = {
+                    "size": row[0],
+                    "mtime_ns": row[1],
+                    "sha256": row[2],
+                    "urls": json.loads(row[3])
+                }
+        return records
+
+    def put_manifest(self, records: Dict[str, Dict]):
+        """Store manifest records as returned by get_manifest"""
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO file_manifest (path, size, mtime_ns, sha256, urls) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                (path, r["size"], r["mtime_ns"], r["sha256"], json.dumps(r["urls"]))
+                for path, r in records.items()
+            ]
+        )
+        self.conn.commit()
+
+    def clear(self):
+        self.conn.execute("DELETE FROM url_cache")
+        self.conn.execute("DELETE FROM file_manifest")
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+class HostScheduler:
+    """Per-host concurrency limits and minimum spacing between requests to a host"""
+
+    def __init__(self, per_host: int = 4, min_delay: float = 0.0):
+        self.per_host = max(1, per_host)
+        self.min_delay = min_delay
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._spacing_locks: Dict[str, asyncio.Lock] = {}
+        self._next_allowed: Dict[str, float] = {}
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        try:
+            parsed = urlparse(url)
+            host = (parsed.hostname or "").lower()
+            port = parsed.port
+        except ValueError:
+            return ""
+        return f"{host}:{port}" if port else host
+
+    @classmethod
+    def interleave(cls, urls: List[str]) -> List[str]:
+        """
+        Order URLs round-robin across hosts
+
+        Keeps one busy host from occupying every connection slot while the
+        URLs for other hosts wait behind it.
+        """
+        by_host: "OrderedDict[str, List[str]]" = OrderedDict()
+        for url in urls:
+            by_host.setdefault(cls.host_of(url), []).append(url)
+
+        ordered = []
+        queues = [list(reversed(host_urls)) for host_urls in by_host.values()]
+        while queues:
+            for queue in queues:
+                ordered.append(queue.pop())
+            queues = [queue for queue in queues if queue]
+
+        return ordered
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """Hold one of the host's concurrency slots, honouring the minimum delay"""
+        host = self.host_of(url)
+        semaphore = self._semaphores.setdefault(host, asyncio.Semaphore(self.per_host))
+
+        async with semaphore:
+            if self.min_delay > 0:
+                loop = asyncio.get_running_loop()
+                async with self._spacing_locks.setdefault(host, asyncio.Lock()):
+                    wait = self._next_allowed.get(host, 0.0) - loop.time()
+                    if wait > 0:
+                        await asyncio.sleep(wait)
+                    self._next_allowed[host] = loop.time() + self.min_delay
+            yield
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker that fast-fails hosts which are clearly down
+
+    After the cool-down the circuit is half-open: exactly one request is
+    let through as a probe while every other request for the host keeps
+    failing fast. The probe's outcome closes the circuit or re-opens it
+    for another cool-down. A probe that never reports back (cancelled
+    mid-request) is given up on after one cool-down.
+    """
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        # Host -> when its half-open probe was let through
+        self._probing: Dict[str, float] = {}
+
+    def is_open(self, host: str) -> bool:
+        opened_at = self._opened_at.get(host)
+        if opened_at is None:
+            return False
+        now = time.monotonic()
+        probe_started = self._probing.get(host)
+        if probe_started is not None and now - probe_started < self.cooldown:
+            return True
+        if now - opened_at >= self.cooldown:
+            # Half-open: this caller is the probe
+            self._probing[host] = now
+            return False
+        return True
+
+    def record_success(self, host: str):
+        self._failures.pop(host, None)
+        self._opened_at.pop(host, None)
+        self._probing.pop(host, None)
+
+    def record_failure(self, host: str):
+        if self._probing.pop(host, None) is not None:
+            # The probe failed: stay open for another cool-down
+            self._opened_at[host] = time.monotonic()
+            return
+        self._failures[host] = self._failures.get(host, 0) + 1
+        if self.failure_threshold > 0 and self._failures[host] >= self.failure_threshold:
+            self._opened_at[host] = time.monotonic()
+
+
+class CachingResolver(AbstractResolver):
+    """
+    DNS resolver whose answers outlive a single ClientSession
+
+    Answers are kept for ttl seconds and shared by every session (and event
+    loop) that uses this instance; concurrent lookups of one host share a
+    single query. With a path, answers are persisted as JSON so the next
+    run starts warm. getaddrinfo() does not expose record TTLs, so one
+    configured TTL applies to every answer.
+    """
+
+    DEFAULT_TTL = 300.0
+
+    def __init__(self, ttl: float = DEFAULT_TTL, path: Optional[str] = None):
+        self.ttl = ttl
+        self.path = Path(path) if path else None
+        self.hits = 0
+        self.misses = 0
+        # (host, port, family) -> (expires_at wall clock, answers)
+        self._entries: Dict[Tuple[str, int, int], Tuple[float, List[Dict]]] = {}
+        self._inflight: Dict[Tuple[str, int, int], asyncio.Future] = {}
+        self._resolver: Optional[AbstractResolver] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._dirty = False
+        if self.path:
+            self._load()
+
+    async def resolve(self, host: str, port: int = 0,
+                      family: socket.AddressFamily = socket.AF_INET) -> List[ResolveResult]:
+        key = (host.lower(), port, int(family))
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.time():
+            self.hits += 1
+            return [dict(answer) for answer in entry[1]]
+
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # The wrapped resolver and pending lookups are bound to one loop
+            self._loop = loop
+            self._resolver = DefaultResolver()
+            self._inflight = {}
+
+        pending = self._inflight.get(key)
+        if pending is None:
+            self.misses += 1
+            pending = loop.create_task(self._lookup(key, host, port, family))
+            self._inflight[key] = pending
+        # Shielded so one cancelled caller does not fail the others
+        answers = await asyncio.shield(pending)
+        return [dict(answer) for answer in answers]
+
+    async def _lookup(self, key: Tuple[str, int, int], host: str, port: int,
+                      family: socket.AddressFamily) -> List[ResolveResult]:
+        try:
+            answers = await self._resolver.resolve(host, port, family)
+        finally:
+            self._inflight.pop(key, None)
+        self._entries[key] = (time.time() + self.ttl, [dict(answer) for answer in answers])
+        self._dirty = True
+        return answers
+
+    async def close(self):
+        # Shared across sessions, so a closing connector must not tear it down
+        pass
+
+    async def prime(self, urls: List[str], timeout: Optional[float] = None):
+        """
+        Resolve every distinct host among urls concurrently
+
+        Failures are ignored here; the request that needs the host will
+        surface them. IP literals are skipped.
+        """
+        targets = {}
+        for url in urls:
+            try:
+                parsed = urlparse(url)
+                host = parsed.hostname
+                port = parsed.port or DEFAULT_PORTS.get(parsed.scheme, 0)
+            except ValueError:
+                continue
+            if not host or _is_ip_address(host):
+                continue
+            targets[(host, port)] = None
+
+        if not targets:
+            return
+        lookups = asyncio.gather(
+            *(self.resolve(host, port, socket.AF_UNSPEC) for host, port in targets),
+            return_exceptions=True
+        )
+        try:
+            await asyncio.wait_for(lookups, timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def stats(self) -> Dict:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def save(self):
+        """Persist unexpired answers if a path was given and anything changed"""
+        if not self.path or not self._dirty:
+            return
+        now = time.time()
+        records = [
+            {"host": host, "port": port, "family": family, "expires_at": expires_at, "answers": answers}
+            for (host, port, family), (expires_at, answers) in self._entries.items()
+            if expires_at > now
+        ]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(records), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def _load(self):
+        try:
+            records = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        now = time.time()
+        for record in records:
+            if record["expires_at"] > now:
+                key = (record["host"], record["port"], record["family"])
+                self._entries[key] = (record["expires_at"], record["answers"])
+
+
+def _is_ip_address(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+        return True
+    except ValueError:
+        return False
+
+
+_shared_resolver: Optional[CachingResolver] = None
+
+
+def shared_resolver() -> CachingResolver:
+    """Process-wide in-memory resolver used by validators that are not given one"""
+    global _shared_resolver
+    if _shared_resolver is None:
+        _shared_resolver = CachingResolver()
+    return _shared_resolver
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return 0.0
+    rank = max(int(-(-pct * len(ordered) // 100)), 1)
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _latency_stats(latencies: List[float]) -> Dict:
+    ordered = sorted(latencies)
+    return {
+        "count": len(ordered),
+        "p50": round(_percentile(ordered, 50), 4),
+        "p95": round(_percentile(ordered, 95), 4),
+        "p99": round(_percentile(ordered, 99), 4),
+        "max": round(ordered[-1], 4) if ordered else 0.0
+    }
+
+
+def performance_summary(results: List[URLCheckResult]) -> Dict:
+    """
+    Aggregate latency percentiles and per-host statistics
+
+    Cache hits and URLs never sent (open circuit, budget) are counted but
+    excluded from latency figures; spelling variants of one canonical URL
+    count once.
+
+    Args:
+        results: URLCheckResult list from check_urls or iter_validate
+
+    Returns:
+        Dictionary with overall 'latency' and a 'hosts' breakdown
+    """
+    unique: Dict[str, URLCheckResult] = {}
+    for result in results:
+        unique.setdefault(result.canonical_url or result.url, result)
+
+    hosts: Dict[str, Dict] = {}
+    host_latencies: Dict[str, List[float]] = {}
+    latencies: List[float] = []
+    for url, result in unique.items():
+        host = HostScheduler.host_of(url)
+        stats = hosts.setdefault(host, {"urls": 0, "cache_hits": 0, "requests": 0,
+                                        "failures": 0, "statuses": {}})
+        stats["urls"] += 1
+        stats["statuses"][result.status] = stats["statuses"].get(result.status, 0) + 1
+        if result.status == "invalid":
+            stats["failures"] += 1
+        if result.from_cache:
+            stats["cache_hits"] += 1
+        elif result.attempts > 0 and result.status != "unverified":
+            stats["requests"] += result.attempts
+            latencies.append(result.latency)
+            host_latencies.setdefault(host, []).append(result.latency)
+
+    for host, stats in hosts.items():
+        stats["latency"] = _latency_stats(host_latencies.get(host, []))
+
+    return {
+        "latency": _latency_stats(latencies),
+        "hosts": dict(sorted(hosts.items(), key=lambda item: -item[1]["latency"]["p95"]))
+    }
 
 
 class URLValidator:
     """Validates URLs in research documents and provides status reports"""
 
-    def __init__(self, timeout: int = 10, max_concurrent: int = 10):
+    # Verdicts written to the cache per transaction while streaming
+    CACHE_WRITE_BATCH = 100
+
+    # Below this many files, scanning in-process beats process pool startup
+    PARALLEL_SCAN_THRESHOLD = 32
+
+    def __init__(self, timeout: int = 10, max_concurrent: int = 10,
+                 cache: Optional[URLValidationCache] = None,
+                 per_host: int = 4, host_delay: float = 0.0,
+                 retries: int = 2, backoff_base: float = 0.5, max_backoff: float = 30.0,
+                 breaker_threshold: int = 3, breaker_cooldown: float = 60.0,
+                 follow_redirects: bool = False, max_redirects: int = 5,
+                 canonicalizer: Optional[URLCanonicalizer] = None, canonicalize: bool = True,
+                 budget: Optional[float] = None,
+                 resolver: Optional[CachingResolver] = None):
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.max_concurrent = max_concurrent
+        self.cache = cache
+        self.per_host = per_host
+        self.host_delay = host_delay
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self.follow_redirects = follow_redirects
+        self.max_redirects = max_redirects
+        self.canonicalizer = (canonicalizer or URLCanonicalizer()) if canonicalize else None
+        # Overall seconds allowed per batch; URLs not checked by then are 'unverified'
+        self.budget = budget
+        self._deadline: Optional[float] = None
+        # DNS answers shared by every session this validator opens
+        self.resolver = resolver or shared_resolver()
+        # Files whose content changed since the last manifest scan
+        self.changed_files: List[str] = []
+        # Redirect hop URL -> final resolved result, cleared at each batch
+        # so a changed redirect target is never answered from a stale memo
+        self._resolved: Dict[str, URLCheckResult] = {}
 
     async def validate_single_url(self, session: aiohttp.ClientSession, url: str) -> Tuple[str, str, Optional[str]]:
         """
@@ -25,32 +838,236 @@ class URLValidator:
             Tuple of (url, status, details)
             status: 'valid', 'redirect', 'warning', 'invalid'
         """
-        try:
-            async with session.head(url, timeout=self.timeout, allow_redirects=False) as response:
-                if response.status == 200:
-                    return (url, "valid", None)
-
-                elif 300 <= response.status < 400:
-                    location = response.headers.get('Location', 'Unknown')
-                    return (url, "redirect", f"Redirects to {location}")
+        result = await self.check_url(session, url)
+        if self.follow_redirects and result.status == "redirect":
+            result = await self.resolve_redirects(session, url, result)
+        return result.as_tuple()
+
+    async def check_url(self, session: aiohttp.ClientSession, url: str,
+                        cached: Optional[Dict] = None,
+                        breaker: Optional[CircuitBreaker] = None) -> URLCheckResult:
+        """
+        Check a single URL with a HEAD request, retrying transient failures
 
-                elif 400 <= response.status < 500:
-                    return (url, "invalid", f"Client error: {response.status}")
+        Timeouts, connection errors, 429 and 5xx responses are retried with
+        jittered exponential backoff, honouring Retry-After when present.
+        When a stale cache record carries an ETag or Last-Modified value the
+        request is made conditional, and a 304 keeps the cached verdict.
 
-                elif 500 <= response.status < 600:
-                    return (url, "warning", f"Server error: {response.status}")
+        Args:
+            session: Shared client session
+            url: URL to check
+            cached: Stale cache record for the URL, if any
+            breaker: Per-host circuit breaker shared across the batch
 
+        Returns:
+            URLCheckResult
+        """
+        host = HostScheduler.host_of(url)
+        result = None
+
+        for attempt in range(self.retries + 1):
+            if breaker and breaker.is_open(host):
+                if result:
+                    break
+                return URLCheckResult(url, "invalid",
+                                      "Host unreachable: circuit open after repeated failures",
+                                      attempts=0)
+
+            result, retry_after, host_failure = await self._request_once(session, url, cached)
+            result.attempts = attempt + 1
+
+            if breaker:
+                if host_failure:
+                    breaker.record_failure(host)
                 else:
-                    return (url, "warning", f"Unexpected status: {response.status}")
+                    breaker.record_success(host)
+
+            if retry_after is None or attempt == self.retries:
+                break
+
+            delay = self._backoff_delay(attempt, retry_after)
+            if delay is None or (self._deadline and time.monotonic() + delay >= self._deadline):
+                break
+            await asyncio.sleep(delay)
+
+        return result
+
+    async def _request_once(self, session: aiohttp.ClientSession, url: str,
+                            cached: Optional[Dict]) -> Tuple[URLCheckResult, Optional[float], bool]:
+        """
+        Make one HEAD request, falling back to a one-byte ranged GET
+
+        Returns:
+            Tuple of (result, retry_after, host_failure); retry_after is None
+            when the outcome is final, otherwise the server-requested delay
+            in seconds (0 when the server gave none).
+        """
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        try:
+            status, response_headers = await self._probe(session, "HEAD", url, headers)
+            if status in HEAD_REJECTED_STATUSES:
+                status, response_headers = await self._probe(
+                    session, "GET", url, {**headers, "Range": "bytes=0-0"}
+                )
+            return self._classify(url, status, response_headers, cached)
 
         except asyncio.TimeoutError:
-            return (url, "invalid", "Request timeout")
+            if self._deadline and time.monotonic() >= self._deadline:
+                # Cut short by the budget, which says nothing about the host
+                return URLCheckResult(url, "unverified", "Time budget exhausted"), None, False
+            return URLCheckResult(url, "invalid", "Request timeout"), 0.0, True
+
+        except aiohttp.InvalidURL as e:
+            # Malformed URL (e.g. a placeholder port): final, and says nothing about the host
+            return URLCheckResult(url, "invalid", f"Connection error: {type(e).__name__}"), None, False
 
         except aiohttp.ClientError as e:
-            return (url, "invalid", f"Connection error: {type(e).__name__}")
+            return URLCheckResult(url, "invalid", f"Connection error: {type(e).__name__}"), 0.0, True
 
         except Exception as e:
-            return (url, "invalid", f"Unexpected error: {type(e).__name__}")
+            return URLCheckResult(url, "invalid", f"Unexpected error: {type(e).__name__}"), None, False
+
+    async def _probe(self, session: aiohttp.ClientSession, method: str, url: str,
+                     headers: Dict[str, str]) -> Tuple[int, Dict[str, str]]:
+        # Leaving the context without reading the body closes the connection,
+        # so a server that ignores Range never streams the full page to us
+        async with session.request(method, url, timeout=self._request_timeout(),
+                                   allow_redirects=False, headers=headers) as response:
+            return response.status, dict(response.headers)
+
+    def _request_timeout(self) -> aiohttp.ClientTimeout:
+        """Per-request timeout, shrunk to whatever is left of the budget"""
+        if self._deadline is None:
+            return self.timeout
+        remaining = max(self._deadline - time.monotonic(), 0.001)
+        return aiohttp.ClientTimeout(total=min(self.timeout.total, remaining))
+
+    def _classify(self, url: str, status: int, headers: Dict[str, str],
+                  cached: Optional[Dict]) -> Tuple[URLCheckResult, Optional[float], bool]:
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        retry_after = None
+        if status in RETRYABLE_STATUSES:
+            retry_after = self._parse_retry_after(headers.get('Retry-After'))
+
+        if status == 304 and cached:
+            result = URLCheckResult(url, cached["status"], cached["details"],
+                                    etag or cached.get("etag"),
+                                    last_modified or cached.get("last_modified"))
+
+        elif status in (200, 206):
+            result = URLCheckResult(url, "valid", None, etag, last_modified)
+
+        elif 300 <= status < 400:
+            location = headers.get('Location')
+            result = URLCheckResult(url, "redirect", f"Redirects to {location or 'Unknown'}",
+                                    final_url=urljoin(url, location) if location else None)
+
+        elif status == 429:
+            result = URLCheckResult(url, "warning", "Rate limited: 429")
+
+        elif 400 <= status < 500:
+            result = URLCheckResult(url, "invalid", f"Client error: {status}")
+
+        elif 500 <= status < 600:
+            result = URLCheckResult(url, "warning", f"Server error: {status}")
+
+        else:
+            result = URLCheckResult(url, "warning", f"Unexpected status: {status}")
+
+        return result, retry_after, status >= 500
+
+    async def resolve_redirects(self, session: aiohttp.ClientSession, url: str,
+                                first: URLCheckResult,
+                                scheduler: Optional[HostScheduler] = None,
+                                breaker: Optional[CircuitBreaker] = None) -> URLCheckResult:
+        """
+        Follow a redirect chain hop by hop up to max_redirects
+
+        Every hop's final outcome is memoized until the next reset_redirects(),
+        so URLs that share a redirector (DOI resolvers, URL shorteners) only
+        resolve it once per batch.
+
+        Returns:
+            Result for url carrying the final target's verdict
+        """
+        chain = [url]
+        attempts = first.attempts
+        current = first
+        final = None
+
+        for _ in range(self.max_redirects):
+            target = current.final_url
+            if not target:
+                final = current
+                break
+            if target in self._resolved:
+                final = self._resolved[target]
+                break
+            if target in chain:
+                final = URLCheckResult(target, "warning", "Redirect loop")
+                break
+
+            chain.append(target)
+            if scheduler:
+                async with scheduler.slot(target):
+                    current = await self.check_url(session, target, None, breaker)
+            else:
+                current = await self.check_url(session, target, None, breaker)
+            attempts += current.attempts
+
+            if current.status != "redirect":
+                final = current
+                break
+
+        if final is None:
+            return URLCheckResult(url, "redirect",
+                                  f"More than {self.max_redirects} redirects, last hop {current.final_url}",
+                                  attempts=attempts, final_url=current.final_url)
+
+        final_url = final.final_url or final.url
+        for hop in chain[1:]:
+            self._resolved[hop] = URLCheckResult(hop, final.status, final.details,
+                                                 attempts=0, final_url=final_url)
+
+        details = f"Resolved via {len(chain) - 1} redirect(s) to {final_url}"
+        if final.details:
+            details = f"{details}: {final.details}"
+        return URLCheckResult(url, final.status, details, attempts=attempts, final_url=final_url)
+
+    def reset_redirects(self):
+        """Forget memoized redirect outcomes; called at the start of each batch"""
+        self._resolved.clear()
+
+    def _backoff_delay(self, attempt: int, retry_after: float) -> Optional[float]:
+        """Full-jitter exponential backoff, never shorter than Retry-After"""
+        if retry_after > self.max_backoff:
+            # The server asked for a longer pause than we are willing to wait
+            return None
+        delay = random.uniform(0, min(self.max_backoff, self.backoff_base * (2 ** attempt)))
+        return max(delay, retry_after)
+
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> float:
+        if not value:
+            return 0.0
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return 0.0
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
 
     async def validate_urls_batch(self, urls: List[str]) -> List[Tuple[str, str, Optional[str]]]:
         """
@@ -62,20 +1079,184 @@ class URLValidator:
         Returns:
             List of (url, status, details) tuples
         """
-        connector = aiohttp.TCPConnector(limit=self.max_concurrent)
+        self.changed_files = []
+        results = await self.check_urls(urls)
+        return [result.as_tuple() for result in results]
 
-        async with aiohttp.ClientSession(connector=connector, timeout=self.timeout) as session:
-            tasks = [self.validate_single_url(session, url) for url in urls]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+    async def check_urls(self, urls: List[str],
+                         sources: Optional[Dict[str, List[str]]] = None) -> List[URLCheckResult]:
+        """
+        Check multiple URLs concurrently, answering fresh ones from the cache
 
-            validated_results: List[Tuple[str, str, Optional[str]]] = []
-            for result in results:
-                if isinstance(result, Exception):
-                    validated_results.append(("", "invalid", f"Validation error: {type(result).__name__}"))
-                else:
-                    validated_results.append(result)
+        Args:
+            urls: List of URLs to check
+            sources: URL -> files citing it, used for prioritization
+
+        Returns:
+            List of URLCheckResult in the same order as urls
+        """
+        results: Dict[str, URLCheckResult] = {}
+        async for result in self.iter_validate(urls, sources):
+            results[result.url] = result
+
+        return [results[url] for url in urls]
 
-            return validated_results
+    async def iter_validate(self, urls: List[str],
+                            sources: Optional[Dict[str, List[str]]] = None) -> AsyncIterator[URLCheckResult]:
+        """
+        Yield results as soon as each URL finishes
+
+        Spelling variants of one resource are collapsed to their canonical
+        URL, which keys the cache; the first cited spelling is requested
+        once and its verdict yielded for every original spelling. Cache
+        hits are yielded first, then network checks in completion order.
+        Verdicts are written to the cache in small batches so memory stays
+        flat however many URLs are checked.
+
+        Network checks start in priority order: never cached, cited by a
+        changed file, cited by references.md, previously failing. With a
+        budget set, whatever is still pending at the deadline is yielded
+        as 'unverified'.
+
+        Args:
+            urls: URLs to check (duplicates are checked once)
+            sources: URL -> files citing it, used for prioritization
+
+        Yields:
+            URLCheckResult per unique URL, as originally spelled
+        """
+        sources = sources or {}
+        if not self.canonicalizer:
+            async for result in self._iter_checks(list(dict.fromkeys(urls)), sources):
+                yield result
+            return
+
+        variants = self.canonicalizer.group(urls)
+        # First cited spelling of each resource -> its canonical URL
+        keys = {originals[0]: canonical for canonical, originals in variants.items()}
+        group_sources = {
+            originals[0]: [f for original in originals for f in sources.get(original, [])]
+            for originals in variants.values()
+        }
+        async for result in self._iter_checks(list(keys), group_sources, keys):
+            canonical = keys[result.url]
+            for original in variants[canonical]:
+                yield replace(result, url=original, canonical_url=canonical)
+
+    async def _iter_checks(self, urls: List[str], sources: Dict[str, List[str]],
+                           keys: Optional[Dict[str, str]] = None) -> AsyncIterator[URLCheckResult]:
+        """Check urls as spelled; keys maps a URL to its cache key when they differ"""
+        keys = keys or {}
+        started = time.monotonic()
+        to_check: Dict[str, Optional[Dict]] = {}
+
+        for url in urls:
+            record = self.cache.get(keys.get(url, url), self.follow_redirects) if self.cache else None
+            if record and record["fresh"]:
+                yield URLCheckResult(url, record["status"], record["details"],
+                                     record["etag"], record["last_modified"],
+                                     from_cache=True, attempts=0)
+            else:
+                to_check[url] = record
+
+        if not to_check:
+            return
+
+        self.reset_redirects()
+        connector = aiohttp.TCPConnector(limit=self.max_concurrent, resolver=self.resolver)
+        scheduler = HostScheduler(self.per_host, self.host_delay)
+        breaker = CircuitBreaker(self.breaker_threshold, self.breaker_cooldown)
+        pending_cache: List[URLCheckResult] = []
+
+        # Interleaving keeps hosts mixed within each priority tier (sort is stable)
+        changed = set(self.changed_files)
+        ordered = sorted(scheduler.interleave(list(to_check)),
+                         key=lambda url: self._priority(to_check[url], sources.get(url, []), changed))
+        self._deadline = started + self.budget if self.budget else None
+
+        async with aiohttp.ClientSession(connector=connector, timeout=self.timeout) as session:
+            # Resolve every host in the background; a check whose host is still
+            # being resolved joins that lookup instead of waiting for all of them
+            priming = asyncio.ensure_future(self.resolver.prime(ordered, self._request_timeout().total))
+
+            tasks = {
+                asyncio.ensure_future(
+                    self._scheduled_check(scheduler, breaker, session, url, to_check[url])
+                ): url
+                for url in ordered
+            }
+            pending = set(tasks)
+
+            try:
+                while pending:
+                    wait = None
+                    if self._deadline is not None:
+                        wait = max(self._deadline - time.monotonic(), 0)
+                    done, pending = await asyncio.wait(pending, timeout=wait,
+                                                       return_when=asyncio.FIRST_COMPLETED)
+                    if not done:
+                        break
+
+                    for task in done:
+                        result = task.result()
+
+                        # Results that never reached the host (open circuit, budget) are not verdicts
+                        if self.cache and result.attempts > 0 and result.status != "unverified":
+                            pending_cache.append(replace(result, url=keys.get(result.url, result.url)))
+                            if len(pending_cache) >= self.CACHE_WRITE_BATCH:
+                                self.cache.put_many(pending_cache, self.follow_redirects)
+                                pending_cache = []
+
+                        yield result
+
+                for task in pending:
+                    url = tasks[task]
+                    details = f"Not checked within the {self.budget:g}s budget"
+                    if to_check[url]:
+                        details = f"{details}; last verdict: {to_check[url]['status']}"
+                    yield URLCheckResult(url, "unverified", details, attempts=0)
+            finally:
+                priming.cancel()
+                for task in tasks:
+                    task.cancel()
+                self._deadline = None
+                if self.cache and pending_cache:
+                    self.cache.put_many(pending_cache, self.follow_redirects)
+                self.resolver.save()
+
+    @staticmethod
+    def _priority(cached: Optional[Dict], files: List[str], changed: set) -> Tuple[bool, bool, bool, bool]:
+        """Sort key: never cached, new, cited by references.md, previously failing"""
+        return (
+            cached is not None,
+            not any(f in changed for f in files),
+            not any(Path(f).name == "references.md" for f in files),
+            not (cached and cached["status"] in ("invalid", "warning"))
+        )
+
+    async def _scheduled_check(self, scheduler: HostScheduler, breaker: CircuitBreaker,
+                               session: aiohttp.ClientSession, url: str,
+                               cached: Optional[Dict]) -> URLCheckResult:
+        try:
+            async with scheduler.slot(url):
+                started = time.perf_counter()
+                result = await self.check_url(session, url, cached, breaker)
+                latency = time.perf_counter() - started
+
+            # Hops are fetched after releasing this host's slot, so a task never
+            # holds two hosts' slots at once
+            if self.follow_redirects and result.status == "redirect":
+                started = time.perf_counter()
+                result = await self.resolve_redirects(session, url, result, scheduler, breaker)
+                latency += time.perf_counter() - started
+            result.latency = latency
+            return result
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception as e:
+            return URLCheckResult(url, "invalid", f"Validation error: {type(e).__name__}")
 
     def extract_urls_from_markdown(self, content: str) -> List[str]:
         """
@@ -85,14 +1266,9 @@ class URLValidator:
             content: Markdown text
 
         Returns:
-            List of unique URLs found in the content
+            List of unique URLs in document order
         """
-        url_pattern = r'https?://[^\s\)\]\}]+'
-        urls = re.findall(url_pattern, content)
-
-        urls = [url.rstrip('.,;:') for url in urls]
-
-        return list(set(urls))
+        return list(dict.fromkeys(url for url, _ in extract_links(content)))
 
     def validate_markdown_file(self, file_path: str) -> Dict:
         """
@@ -104,6 +1280,8 @@ class URLValidator:
         Returns:
             Dictionary with validation results
         """
+        # No manifest scan here, so nothing is known to have changed in this run
+        self.changed_files = []
         path = Path(file_path)
 
         if not path.exists():
@@ -112,53 +1290,31 @@ class URLValidator:
                 "valid": False
             }
 
-        content = path.read_text(encoding="utf-8")
-        urls = self.extract_urls_from_markdown(content)
-
-        if not urls:
-            return {
-                "file": str(path),
-                "total": 0,
-                "valid": 0,
-                "invalid": 0,
-                "warning": 0,
-                "redirect": 0,
-                "urls": []
-            }
-
-        results = asyncio.run(self.validate_urls_batch(urls))
-
-        summary = {
-            "file": str(path),
-            "total": len(results),
-            "valid": 0,
-            "invalid": 0,
-            "warning": 0,
-            "redirect": 0,
-            "urls": []
-        }
-
-        for url, status, details in results:
-            if isinstance(url, str):
-                summary[status] = summary.get(status, 0) + 1
-                summary["urls"].append({
-                    "url": url,
-                    "status": status,
-                    "details": details
-                })
+        urls = self.extract_urls_from_markdown(path.read_text(encoding="utf-8"))
+        results = asyncio.run(self.check_urls(urls, {url: [str(path)] for url in urls})) if urls else []
 
+        summary = self._summarize_file(path, urls, {r.url: r for r in results})
+        summary["performance"] = performance_summary(results)
         return summary
 
-    def validate_directory(self, dir_path: str) -> Dict:
+    def validate_directory(self, dir_path: str, recursive: bool = False,
+                           workers: Optional[int] = None) -> Dict:
         """
         Validate all markdown files in a directory
 
+        URLs from every file are collected and de-duplicated first, then
+        validated together in one event loop on one pooled session; the
+        verdicts are fanned back out to each citing file.
+
         Args:
             dir_path: Path to directory containing markdown files
+            recursive: Also scan subdirectories
+            workers: Processes used to scan large trees (default: CPU count)
 
         Returns:
             Dictionary with aggregated results
         """
+        self.changed_files = []
         path = Path(dir_path)
 
         if not path.exists() or not path.is_dir():
@@ -167,7 +1323,7 @@ class URLValidator:
                 "valid": False
             }
 
-        md_files = list(path.glob("*.md"))
+        md_files = self._find_markdown_files(path, recursive)
 
         if not md_files:
             return {
@@ -177,44 +1333,215 @@ class URLValidator:
                 "files": []
             }
 
+        file_urls = self._collect_file_urls(md_files, workers)
+        sources: Dict[str, List[str]] = {}
+        for md_file, urls in file_urls.items():
+            for url in urls:
+                sources.setdefault(url, []).append(str(md_file))
+        unique_urls = list(sources)
+        results = asyncio.run(self.check_urls(unique_urls, sources)) if unique_urls else []
+        results_by_url = {r.url: r for r in results}
+
         aggregated = {
             "directory": str(path),
             "total_files": len(md_files),
             "total_urls": 0,
+            "unique_urls": len(unique_urls),
+            "checked_urls": len({r.canonical_url or r.url for r in results}),
+            "changed_files": len(self.changed_files),
             "total_valid": 0,
             "total_invalid": 0,
             "total_warning": 0,
             "total_redirect": 0,
+            "total_unverified": 0,
             "files": []
         }
 
         for md_file in md_files:
-            result = self.validate_markdown_file(str(md_file))
+            result = self._summarize_file(md_file, file_urls[md_file], results_by_url)
             aggregated["files"].append(result)
             aggregated["total_urls"] += result.get("total", 0)
             aggregated["total_valid"] += result.get("valid", 0)
             aggregated["total_invalid"] += result.get("invalid", 0)
             aggregated["total_warning"] += result.get("warning", 0)
             aggregated["total_redirect"] += result.get("redirect", 0)
+            aggregated["total_unverified"] += result.get("unverified", 0)
 
+        aggregated["performance"] = performance_summary(results)
         return aggregated
 
+    def stream_validation(self, target: str, out: TextIO,
+                          output_format: str = "text", recursive: bool = False,
+                          workers: Optional[int] = None) -> Dict:
+        """
+        Validate a file or directory, writing each row as soon as it is known
+
+        Args:
+            target: Markdown file or directory of markdown files
+            out: Stream receiving the report
+            output_format: 'text', 'markdown', 'json' or 'ndjson'
+            recursive: Also scan subdirectories
+            workers: Processes used to scan large trees
+
+        Returns:
+            Summary counts by status
+        """
+        self.changed_files = []
+        path = Path(target)
+        writer = StreamingReportWriter(out, output_format)
+
+        if path.is_dir():
+            md_files = self._find_markdown_files(path, recursive)
+        elif path.exists():
+            md_files = [path]
+        else:
+            writer.error(f"Path not found: {target}")
+            return {"error": f"Path not found: {target}", "valid": False}
+
+        citing_files: Dict[str, List[str]] = {}
+        sources: Dict[str, List[str]] = {}
+        base = path if path.is_dir() else path.parent
+        for md_file, urls in self._collect_file_urls(md_files, workers).items():
+            for url in urls:
+                citing_files.setdefault(url, []).append(os.path.relpath(md_file, base))
+                sources.setdefault(url, []).append(str(md_file))
+
+        writer.begin(str(path), len(md_files),
+                     sum(len(files) for files in citing_files.values()), len(citing_files))
+
+        checked: List[URLCheckResult] = []
+
+        async def consume() -> Dict:
+            counts = {"valid": 0, "invalid": 0, "warning": 0, "redirect": 0}
+            async for result in self.iter_validate(list(citing_files), sources):
+                checked.append(result)
+                for file_name in citing_files[result.url]:
+                    counts[result.status] = counts.get(result.status, 0) + 1
+                    writer.row(result, file_name)
+            return counts
+
+        counts = asyncio.run(consume()) if citing_files else {
+            "valid": 0, "invalid": 0, "warning": 0, "redirect": 0
+        }
+        writer.end(counts, performance_summary(checked))
+        return counts
+
+    @staticmethod
+    def _find_markdown_files(path: Path, recursive: bool) -> List[Path]:
+        return sorted(path.rglob("*.md") if recursive else path.glob("*.md"))
+
+    def _collect_file_urls(self, md_files: List[Path],
+                           workers: Optional[int] = None) -> Dict[Path, List[str]]:
+        """
+        Extract URLs per file, reusing the manifest for unchanged files
+
+        Files whose size and mtime match the manifest are not read at all;
+        the rest are re-scanned, fanning out across processes for large
+        trees. self.changed_files lists files whose content hash changed.
+        """
+        keys = {md_file: str(md_file.resolve()) for md_file in md_files}
+        stats = {md_file: md_file.stat() for md_file in md_files}
+        manifest = self.cache.get_manifest(list(keys.values())) if self.cache else {}
+
+        file_urls: Dict[Path, List[str]] = {}
+        to_scan: List[Path] = []
+        for md_file in md_files:
+            record = manifest.get(keys[md_file])
+            st = stats[md_file]
+            if record and record["size"] == st.st_size and record["mtime_ns"] == st.st_mtime_ns:
+                file_urls[md_file] = record["urls"]
+            else:
+                to_scan.append(md_file)
+
+        if len(to_scan) < self.PARALLEL_SCAN_THRESHOLD or workers == 1:
+            scanned = [_scan_markdown_file(str(f)) for f in to_scan]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                scanned = list(pool.map(_scan_markdown_file, [str(f) for f in to_scan], chunksize=8))
+
+        updates: Dict[str, Dict] = {}
+        self.changed_files = []
+        for md_file, (digest, urls) in zip(to_scan, scanned):
+            file_urls[md_file] = urls
+            previous = manifest.get(keys[md_file])
+            if not previous or previous["sha256"] != digest:
+                self.changed_files.append(str(md_file))
+            updates[keys[md_file]] = {
+                "size": stats[md_file].st_size,
+                "mtime_ns": stats[md_file].st_mtime_ns,
+                "sha256": digest,
+                "urls": urls
+            }
+
+        if self.cache and updates:
+            self.cache.put_manifest(updates)
+
+        return {md_file: file_urls[md_file] for md_file in md_files}
+
+    def _summarize_file(self, path: Path, urls: List[str],
+                        results_by_url: Dict[str, URLCheckResult]) -> Dict:
+        """Build the per-file summary from already-computed verdicts"""
+        summary = {
+            "file": str(path),
+            "total": len(urls),
+            "valid": 0,
+            "invalid": 0,
+            "warning": 0,
+            "redirect": 0,
+            "unverified": 0,
+            "urls": []
+        }
+
+        for url in urls:
+            result = results_by_url[url]
+            summary[result.status] = summary.get(result.status, 0) + 1
+            summary["urls"].append({
+                "url": url,
+                "status": result.status,
+                "details": result.details,
+                "cached": result.from_cache,
+                "attempts": result.attempts,
+                "latency": round(result.latency, 4),
+                "final_url": result.final_url
+            })
+
+        return summary
+
     def generate_validation_report(self, results: Dict, output_format: str = "text") -> str:
         """
-        Generate human-readable validation report
+        Generate a validation report
 
         Args:
             results: Validation results from validate_file or validate_directory
-            output_format: 'text' or 'markdown'
+            output_format: 'text', 'markdown', 'json' or 'ndjson'
 
         Returns:
             Formatted report string
         """
-        if output_format == "markdown":
+        if output_format == "json":
+            return json.dumps(results, indent=2)
+        elif output_format == "ndjson":
+            return self._generate_ndjson_report(results)
+        elif output_format == "markdown":
             return self._generate_markdown_report(results)
         else:
             return self._generate_text_report(results)
 
+    def _generate_ndjson_report(self, results: Dict) -> str:
+        """One JSON object per cited URL, then a summary object"""
+        if "error" in results:
+            return json.dumps({"type": "error", "error": results["error"]})
+
+        lines = []
+        file_results = results["files"] if "directory" in results else [results]
+        for file_result in file_results:
+            for url_info in file_result.get("urls", []):
+                lines.append(json.dumps({"type": "url", "file": file_result["file"], **url_info}))
+
+        summary = {key: value for key, value in results.items() if key not in ("files", "urls")}
+        lines.append(json.dumps({"type": "summary", **summary}))
+        return "\n".join(lines)
+
     def _generate_text_report(self, results: Dict) -> str:
         """Generate plain text report"""
         lines = []
@@ -229,23 +1556,32 @@ class URLValidator:
             lines.append(f"Directory: {results['directory']}")
             lines.append(f"Total Files: {results['total_files']}")
             lines.append(f"Total URLs: {results['total_urls']}")
+            if "unique_urls" in results:
+                lines.append(f"Unique URLs: {results['unique_urls']}")
+            if "checked_urls" in results:
+                lines.append(f"Checked URLs: {results['checked_urls']}")
+            if "changed_files" in results:
+                lines.append(f"Changed Files: {results['changed_files']}")
             lines.append("")
             lines.append(f"Summary:")
             lines.append(f"  ✓ Valid: {results['total_valid']}")
             lines.append(f"  ✗ Invalid: {results['total_invalid']}")
             lines.append(f"  ⚠ Warning: {results['total_warning']}")
             lines.append(f"  → Redirect: {results['total_redirect']}")
+            if results.get("total_unverified"):
+                lines.append(f"  … Unverified: {results['total_unverified']}")
             lines.append("")
 
             for file_result in results["files"]:
                 if file_result.get("total", 0) > 0:
-                    lines.append(f"\n{Path(file_result['file']).name}:")
+                    lines.append(f"\n{os.path.relpath(file_result['file'], results['directory'])}:")
                     for url_info in file_result["urls"]:
                         status_icon = {
                             "valid": "✓",
                             "invalid": "✗",
                             "warning": "⚠",
-                            "redirect": "→"
+                            "redirect": "→",
+                            "unverified": "…"
                         }.get(url_info["status"], "?")
 
                         lines.append(f"  {status_icon} {url_info['url']}")
@@ -263,6 +1599,8 @@ class URLValidator:
             lines.append(f"  ✗ Invalid: {results['invalid']}")
             lines.append(f"  ⚠ Warning: {results['warning']}")
             lines.append(f"  → Redirect: {results['redirect']}")
+            if results.get("unverified"):
+                lines.append(f"  … Unverified: {results['unverified']}")
             lines.append("")
 
             for url_info in results["urls"]:
@@ -270,7 +1608,8 @@ class URLValidator:
                     "valid": "✓",
                     "invalid": "✗",
                     "warning": "⚠",
-                    "redirect": "→"
+                    "redirect": "→",
+                    "unverified": "…"
                 }.get(url_info["status"], "?")
 
                 lines.append(f"  {status_icon} {url_info['url']}")
@@ -292,22 +1631,31 @@ class URLValidator:
             lines.append(f"\n**Directory:** `{results['directory']}`")
             lines.append(f"**Total Files:** {results['total_files']}")
             lines.append(f"**Total URLs:** {results['total_urls']}")
+            if "unique_urls" in results:
+                lines.append(f"**Unique URLs:** {results['unique_urls']}")
+            if "checked_urls" in results:
+                lines.append(f"**Checked URLs:** {results['checked_urls']}")
+            if "changed_files" in results:
+                lines.append(f"**Changed Files:** {results['changed_files']}")
             lines.append("\n## Summary\n")
             lines.append(f"- ✅ **Valid:** {results['total_valid']}")
             lines.append(f"- ❌ **Invalid:** {results['total_invalid']}")
             lines.append(f"- ⚠️ **Warning:** {results['total_warning']}")
             lines.append(f"- 🔄 **Redirect:** {results['total_redirect']}")
+            if results.get("total_unverified"):
+                lines.append(f"- ⏳ **Unverified:** {results['total_unverified']}")
             lines.append("\n## Details\n")
 
             for file_result in results["files"]:
                 if file_result.get("total", 0) > 0:
-                    lines.append(f"\n### `{Path(file_result['file']).name}`\n")
+                    lines.append(f"\n### `{os.path.relpath(file_result['file'], results['directory'])}`\n")
                     for url_info in file_result["urls"]:
                         status_emoji = {
                             "valid": "✅",
                             "invalid": "❌",
                             "warning": "⚠️",
-                            "redirect": "🔄"
+                            "redirect": "🔄",
+                            "unverified": "⏳"
                         }.get(url_info["status"], "❓")
 
                         lines.append(f"- {status_emoji} `{url_info['url']}`")
@@ -323,6 +1671,8 @@ class URLValidator:
             lines.append(f"- ❌ **Invalid:** {results['invalid']}")
             lines.append(f"- ⚠️ **Warning:** {results['warning']}")
             lines.append(f"- 🔄 **Redirect:** {results['redirect']}")
+            if results.get("unverified"):
+                lines.append(f"- ⏳ **Unverified:** {results['unverified']}")
             lines.append("\n## URLs\n")
 
             for url_info in results["urls"]:
@@ -330,7 +1680,8 @@ class URLValidator:
                     "valid": "✅",
                     "invalid": "❌",
                     "warning": "⚠️",
-                    "redirect": "🔄"
+                    "redirect": "🔄",
+                    "unverified": "⏳"
                 }.get(url_info["status"], "❓")
 
                 lines.append(f"- {status_emoji} `{url_info['url']}`")
@@ -340,6 +1691,98 @@ class URLValidator:
         return "\n".join(lines)
 
 
+class StreamingReportWriter:
+    """Writes validation rows as they complete instead of building the report in memory"""
+
+    TEXT_ICONS = {"valid": "✓", "invalid": "✗", "warning": "⚠", "redirect": "→", "unverified": "…"}
+    MARKDOWN_ICONS = {"valid": "✅", "invalid": "❌", "warning": "⚠️", "redirect": "🔄", "unverified": "⏳"}
+
+    def __init__(self, out: TextIO, output_format: str = "text"):
+        self.out = out
+        self.output_format = output_format
+        self.markdown = output_format == "markdown"
+        self._rows = 0
+
+    def error(self, message: str):
+        if self.output_format in ("json", "ndjson"):
+            self._write(json.dumps({"type": "error", "error": message}))
+        elif self.markdown:
+            self._write(f"# URL Validation Error\n\n**Error:** {message}")
+        else:
+            self._write(f"Error: {message}")
+
+    def begin(self, target: str, total_files: int, total_urls: int, unique_urls: int):
+        header = {"target": target, "total_files": total_files,
+                  "total_urls": total_urls, "unique_urls": unique_urls}
+        if self.output_format == "ndjson":
+            self._write(json.dumps({"type": "begin", **header}))
+        elif self.output_format == "json":
+            # A JSON document cannot be flushed piecemeal as valid JSON, but
+            # writing rows as they come keeps memory flat and shows progress
+            self._write(json.dumps(header)[:-1] + ', "results": [')
+        elif self.markdown:
+            self._write("# URL Validation Report")
+            self._write(f"\n**Target:** `{target}`")
+            self._write(f"**Total Files:** {total_files}")
+            self._write(f"**Total URLs:** {total_urls}")
+            self._write(f"**Unique URLs:** {unique_urls}")
+            self._write("\n## Results\n")
+        else:
+            self._write("\nURL Validation Report (streaming)")
+            self._write("=" * 50)
+            self._write(f"Target: {target}")
+            self._write(f"Total Files: {total_files}")
+            self._write(f"Total URLs: {total_urls}")
+            self._write(f"Unique URLs: {unique_urls}")
+            self._write("")
+
+    def row(self, result: URLCheckResult, file_name: str):
+        if self.output_format in ("json", "ndjson"):
+            record = {"file": file_name, **result.to_dict(), "latency": round(result.latency, 4)}
+            if self.output_format == "ndjson":
+                self._write(json.dumps({"type": "url", **record}))
+            else:
+                self._write(("  " if self._rows == 0 else ", ") + json.dumps(record))
+            self._rows += 1
+        elif self.markdown:
+            icon = self.MARKDOWN_ICONS.get(result.status, "❓")
+            self._write(f"- {icon} `{result.url}` ({file_name})")
+            if result.details:
+                self._write(f"  - *{result.details}*")
+        else:
+            icon = self.TEXT_ICONS.get(result.status, "?")
+            self._write(f"  {icon} [{file_name}] {result.url}")
+            if result.details:
+                self._write(f"      {result.details}")
+
+    def end(self, counts: Dict[str, int], performance: Optional[Dict] = None):
+        if self.output_format == "ndjson":
+            self._write(json.dumps({"type": "summary", "counts": counts, "performance": performance}))
+        elif self.output_format == "json":
+            self._write("], " + json.dumps({"counts": counts, "performance": performance})[1:])
+        elif self.markdown:
+            self._write("\n## Summary\n")
+            self._write(f"- ✅ **Valid:** {counts.get('valid', 0)}")
+            self._write(f"- ❌ **Invalid:** {counts.get('invalid', 0)}")
+            self._write(f"- ⚠️ **Warning:** {counts.get('warning', 0)}")
+            self._write(f"- 🔄 **Redirect:** {counts.get('redirect', 0)}")
+            if counts.get("unverified"):
+                self._write(f"- ⏳ **Unverified:** {counts['unverified']}")
+        else:
+            self._write("")
+            self._write("Summary:")
+            self._write(f"  ✓ Valid: {counts.get('valid', 0)}")
+            self._write(f"  ✗ Invalid: {counts.get('invalid', 0)}")
+            self._write(f"  ⚠ Warning: {counts.get('warning', 0)}")
+            self._write(f"  → Redirect: {counts.get('redirect', 0)}")
+            if counts.get("unverified"):
+                self._write(f"  … Unverified: {counts['unverified']}")
+
+    def _write(self, line: str):
+        self.out.write(line + "\n")
+        self.out.flush()
+
+
 def main():
     """CLI entry point"""
     parser = argparse.ArgumentParser(
@@ -349,29 +1792,93 @@ def main():
 
     file_parser = subparsers.add_parser("file", help="Validate URLs in a file")
     file_parser.add_argument("file", help="Path to markdown file")
-    file_parser.add_argument("--format", choices=["text", "markdown"],
+    file_parser.add_argument("--format", choices=["text", "markdown", "json", "ndjson"],
                            default="text", help="Output format")
 
     dir_parser = subparsers.add_parser("dir", help="Validate URLs in a directory")
     dir_parser.add_argument("dir", help="Path to directory")
-    dir_parser.add_argument("--format", choices=["text", "markdown"],
+    dir_parser.add_argument("--format", choices=["text", "markdown", "json", "ndjson"],
                           default="text", help="Output format")
 
+    for sub in (file_parser, dir_parser):
+        sub.add_argument("--no-cache", action="store_true",
+                         help="Ignore the validation cache and check every URL")
+        sub.add_argument("--cache-path", default=URLValidationCache.DEFAULT_PATH,
+                         help="Validation cache location")
+        sub.add_argument("--timeout", type=int, default=10,
+                         help="Per-request timeout in seconds")
+        sub.add_argument("--max-concurrent", type=int, default=10,
+                         help="Maximum concurrent requests overall")
+        sub.add_argument("--per-host", type=int, default=4,
+                         help="Maximum concurrent requests per host")
+        sub.add_argument("--host-delay", type=float, default=0.0,
+                         help="Minimum seconds between requests to the same host")
+        sub.add_argument("--retries", type=int, default=2,
+                         help="Retries for timeouts, connection errors, 429 and 5xx")
+        sub.add_argument("--backoff", type=float, default=0.5,
+                         help="Base backoff in seconds (doubled per retry, with jitter)")
+        sub.add_argument("--breaker-threshold", type=int, default=3,
+                         help="Consecutive host failures before skipping the host (0 disables)")
+        sub.add_argument("--follow-redirects", action="store_true",
+                         help="Follow redirect chains and report the final target's verdict")
+        sub.add_argument("--max-redirects", type=int, default=5,
+                         help="Maximum redirect hops to follow")
+        sub.add_argument("--budget", type=float,
+                         help="Overall seconds for checking; URLs left over are reported as unverified")
+        sub.add_argument("--no-canonicalize", action="store_true",
+                         help="Check every URL spelling separately instead of collapsing variants")
+        sub.add_argument("--dns-cache",
+                         help="Persist resolved host addresses to this JSON file between runs")
+        sub.add_argument("--dns-ttl", type=float, default=CachingResolver.DEFAULT_TTL,
+                         help="Seconds a resolved address is reused")
+        sub.add_argument("--recursive", action="store_true",
+                         help="Scan subdirectories too (dir mode)")
+        sub.add_argument("--workers", type=int,
+                         help="Processes for scanning large trees (default: CPU count)")
+        sub.add_argument("--stream", action="store_true",
+                         help="Write each result as soon as it completes")
+        sub.add_argument("--output", help="Write the report to this file instead of stdout")
+
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
-    validator = URLValidator()
+    cache = None if args.no_cache else URLValidationCache(args.cache_path)
+    validator = URLValidator(
+        timeout=args.timeout,
+        max_concurrent=args.max_concurrent,
+        cache=cache,
+        per_host=args.per_host,
+        host_delay=args.host_delay,
+        retries=args.retries,
+        backoff_base=args.backoff,
+        breaker_threshold=args.breaker_threshold,
+        follow_redirects=args.follow_redirects,
+        max_redirects=args.max_redirects,
+        canonicalize=not args.no_canonicalize,
+        budget=args.budget,
+        resolver=CachingResolver(args.dns_ttl, args.dns_cache)
+    )
+
+    target = args.file if args.command == "file" else args.dir
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+
+    try:
+        if args.stream:
+            validator.stream_validation(target, out, args.format, args.recursive, args.workers)
 
-    if args.command == "file":
-        results = validator.validate_markdown_file(args.file)
-        print(validator.generate_validation_report(results, args.format))
+        elif args.command == "file":
+            results = validator.validate_markdown_file(args.file)
+            out.write(validator.generate_validation_report(results, args.format) + "\n")
 
-    elif args.command == "dir":
-        results = validator.validate_directory(args.dir)
-        print(validator.generate_validation_report(results, args.format))
+        elif args.command == "dir":
+            results = validator.validate_directory(args.dir, args.recursive, args.workers)
+            out.write(validator.generate_validation_report(results, args.format) + "\n")
+    finally:
+        if args.output:
+            out.close()
 
 
 if __name__ == "__main__":